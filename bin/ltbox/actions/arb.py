@@ -11,10 +11,19 @@ from ..patch.avb import (
     extract_image_avb_info,
     patch_chained_image_rollback,
     patch_vbmeta_image_rollback,
+    prefetch_avb_info,
+    read_rollback_index,
 )
 from . import edl, system
 
 
+def _read_image_rollback(image_path: Path) -> int:
+    index = read_rollback_index(image_path)
+    if index is None:
+        index = int(extract_image_avb_info(image_path).get("rollback", "0"))
+    return index
+
+
 class ArbStatus(str, Enum):
     MATCH = "MATCH"
     NEEDS_PATCH = "NEEDS_PATCH"
@@ -39,20 +48,15 @@ def read_anti_rollback(
         utils.ui.echo(
             get_string("act_read_dumped_file").format(name=dumped_boot_path.name)
         )
-        boot_info = extract_image_avb_info(dumped_boot_path)
-        current_boot_rb = int(boot_info.get("rollback", "0"))
+        current_boot_rb = _read_image_rollback(dumped_boot_path)
 
         utils.ui.echo(
             get_string("act_read_dumped_file").format(name=dumped_vbmeta_path.name)
         )
-        vbmeta_info = extract_image_avb_info(dumped_vbmeta_path)
-        current_vbmeta_rb = int(vbmeta_info.get("rollback", "0"))
+        current_vbmeta_rb = _read_image_rollback(dumped_vbmeta_path)
 
     except Exception as e:
-        width = utils.ui.get_term_width()
-        utils.ui.error("\n" + "!" * width)
-        utils.ui.error(get_string("act_err_arb_early_fw"))
-        utils.ui.error("!" * width + "\n")
+        utils.ui.banner([get_string("act_err_arb_early_fw")], char="!", error=True)
 
         utils.ui.error(get_string("act_err_avb_info").format(e=e))
         utils.ui.echo(get_string("act_arb_error"))
@@ -76,11 +80,8 @@ def read_anti_rollback(
     new_boot_rb = 0
     new_vbmeta_rb = 0
     try:
-        new_boot_info = extract_image_avb_info(new_boot_img)
-        new_boot_rb = int(new_boot_info.get("rollback", "0"))
-
-        new_vbmeta_info = extract_image_avb_info(new_vbmeta_img)
-        new_vbmeta_rb = int(new_vbmeta_info.get("rollback", "0"))
+        new_boot_rb = _read_image_rollback(new_boot_img)
+        new_vbmeta_rb = _read_image_rollback(new_vbmeta_img)
     except Exception as e:
         utils.ui.error(get_string("act_err_read_new_info").format(e=e))
         utils.ui.echo(get_string("act_arb_error"))
@@ -119,6 +120,9 @@ def patch_anti_rollback(comparison_result: Tuple[ArbStatus, int, int]) -> None:
             return
 
         utils.ui.echo(get_string("act_arb_step3"))
+        prefetch_avb_info(
+            [const.IMAGE_DIR / const.FN_BOOT, const.IMAGE_DIR / const.FN_VBMETA_SYSTEM]
+        )
 
         patch_chained_image_rollback(
             image_name=const.FN_BOOT,
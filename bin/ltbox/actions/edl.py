@@ -1,10 +1,11 @@
 import itertools
-import shutil
+import os
 import subprocess
 import time
 import traceback
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -76,9 +77,7 @@ def _prompt_partition_selection(labels: List[str]) -> List[str]:
     while True:
         utils.ui.clear()
         width = utils.ui.get_term_width()
-        utils.ui.echo("\n" + "=" * width)
-        utils.ui.echo(f"   {get_string('act_flash_partitions_label_title')}")
-        utils.ui.echo("=" * width + "\n")
+        utils.ui.banner([f"   {get_string('act_flash_partitions_label_title')}"])
 
         count = len(labels)
         for i in range(0, count, 2):
@@ -109,12 +108,12 @@ def _prompt_partition_selection(labels: List[str]) -> List[str]:
             idx = int(choice)
         except ValueError:
             utils.ui.error(get_string("err_invalid_selection"))
-            input(get_string("press_enter_to_continue"))
+            utils.ui.prompt(get_string("press_enter_to_continue"))
             continue
 
         if not 1 <= idx <= len(labels):
             utils.ui.error(get_string("err_invalid_selection"))
-            input(get_string("press_enter_to_continue"))
+            utils.ui.prompt(get_string("press_enter_to_continue"))
             continue
 
         label = labels[idx - 1]
@@ -146,10 +145,7 @@ def flash_partition_labels(
     slot_suffix = ""
     if needs_slot:
         while True:
-            width = utils.ui.get_term_width()
-            utils.ui.echo("\n" + "=" * width)
-            utils.ui.echo("   Select Slot")
-            utils.ui.echo("=" * width + "\n")
+            utils.ui.banner(["   Select Slot"])
             utils.ui.echo("   1. Slot A")
             utils.ui.echo("   2. Slot B\n")
 
@@ -325,8 +321,18 @@ def dump_partitions(
             out_file = const.BACKUP_DIR / f"{target}.img"
             utils.ui.echo(get_string("act_prep_dump").format(target=target))
 
+            # A target that cannot be resolved never touches the device, so
+            # it also skips the stability wait below.
             try:
                 params = ensure_params_or_fail(target)
+            except (ValueError, FileNotFoundError) as e:
+                utils.ui.echo(get_string("act_skip_dump").format(target=target, e=e))
+                continue
+            except Exception as e:
+                utils.ui.error(get_string("act_err_dump").format(target=target, e=e))
+                continue
+
+            try:
                 utils.ui.echo(
                     get_string("act_found_dump_info").format(
                         xml=params["source_xml"],
@@ -490,7 +496,10 @@ def write_anti_rollback(dev: device.DeviceController, skip_reset: bool = False)
     utils.ui.echo(get_string("act_arb_write_finish"))
 
 
-def _prepare_flash_files(skip_dp: bool = False) -> None:
+_FlashCopyPlan = Tuple[List[Path], List[Tuple[Path, Path, Path]], Dict[Path, Exception]]
+
+
+def _plan_flash_copy(skip_dp: bool = False) -> _FlashCopyPlan:
     utils.ui.echo(get_string("act_copy_patched"))
     output_folders_to_copy = [
         const.OUTPUT_DIR,
@@ -498,38 +507,9 @@ def _prepare_flash_files(skip_dp: bool = False) -> None:
         const.OUTPUT_XML_DIR,
     ]
 
-    copied_count = 0
-    for folder in output_folders_to_copy:
-        if folder.exists():
-            try:
-                shutil.copytree(folder, const.IMAGE_DIR, dirs_exist_ok=True)
-                utils.ui.echo(
-                    get_string("act_copied_content").format(
-                        src=folder.name, dst=const.IMAGE_DIR.name
-                    )
-                )
-                copied_count += 1
-            except Exception as e:
-                utils.ui.error(get_string("act_err_copy").format(name=folder.name, e=e))
-
     if not skip_dp:
         if const.OUTPUT_DP_DIR.exists():
-            try:
-                shutil.copytree(
-                    const.OUTPUT_DP_DIR, const.IMAGE_DIR, dirs_exist_ok=True
-                )
-                utils.ui.echo(
-                    get_string("act_copied_content").format(
-                        src=const.OUTPUT_DP_DIR.name, dst=const.IMAGE_DIR.name
-                    )
-                )
-                copied_count += 1
-            except Exception as e:
-                utils.ui.error(
-                    get_string("act_err_copy").format(
-                        name=const.OUTPUT_DP_DIR.name, e=e
-                    )
-                )
+            output_folders_to_copy.append(const.OUTPUT_DP_DIR)
         else:
             utils.ui.echo(
                 get_string("act_skip_dp_copy").format(dir=const.OUTPUT_DP_DIR.name)
@@ -537,13 +517,69 @@ def _prepare_flash_files(skip_dp: bool = False) -> None:
     else:
         utils.ui.echo(get_string("act_req_skip_dp"))
 
+    # All folders are copied on one pool. A destination shared by several
+    # folders keeps the source from the last one, as the sequential copies did.
+    errors: Dict[Path, Exception] = {}
+    plan: Dict[str, Tuple[Path, Path, Path]] = {}
+    for folder in output_folders_to_copy:
+        if not folder.exists():
+            continue
+        try:
+            for src, dst in utils.tree_copy_jobs(folder, const.IMAGE_DIR):
+                plan[os.path.normcase(dst)] = (src, dst, folder)
+        except OSError as e:
+            errors[folder] = e
+
+    return output_folders_to_copy, list(plan.values()), errors
+
+
+def _report_flash_copy(
+    copy_plan: _FlashCopyPlan, results: List[Optional[OSError]]
+) -> None:
+    output_folders_to_copy, jobs, errors = copy_plan
+    for (_, _, folder), error in zip(jobs, results):
+        if error is not None:
+            errors.setdefault(folder, error)
+
+    copied_count = 0
+    for folder in output_folders_to_copy:
+        if not folder.exists():
+            continue
+        if folder in errors:
+            utils.ui.error(
+                get_string("act_err_copy").format(name=folder.name, e=errors[folder])
+            )
+        else:
+            utils.ui.echo(
+                get_string("act_copied_content").format(
+                    src=folder.name, dst=const.IMAGE_DIR.name
+                )
+            )
+            copied_count += 1
+
     if copied_count == 0:
         utils.ui.echo(get_string("act_no_output_folders"))
 
 
+def _flash_copy_jobs(copy_plan: _FlashCopyPlan) -> List[Tuple[Path, Path]]:
+    return [(src, dst) for src, dst, _ in copy_plan[1]]
+
+
+def _prepare_flash_files(skip_dp: bool = False) -> None:
+    copy_plan = _plan_flash_copy(skip_dp)
+    _report_flash_copy(copy_plan, utils.copy_files(_flash_copy_jobs(copy_plan)))
+
+
 def _select_flash_xmls(skip_dp: bool = False) -> Tuple[List[Path], List[Path]]:
-    all_raw_xmls = sorted(list(const.IMAGE_DIR.glob("rawprogram*.xml")))
-    patch_xmls = sorted(list(const.IMAGE_DIR.glob("patch*.xml")))
+    all_raw_xmls: List[Path] = []
+    patch_xmls: List[Path] = []
+    for xml_file in sorted(
+        utils._iter_matching(const.IMAGE_DIR, ("rawprogram*.xml", "patch*.xml"))
+    ):
+        if os.path.normcase(xml_file.name).startswith("rawprogram"):
+            all_raw_xmls.append(xml_file)
+        else:
+            patch_xmls.append(xml_file)
 
     raw_xmls = []
     for xml_file in all_raw_xmls:
@@ -622,7 +658,7 @@ def flash_full_firmware(
 ) -> None:
     utils.ui.echo(get_string("act_start_flash"))
 
-    if not const.IMAGE_DIR.is_dir() or not any(const.IMAGE_DIR.iterdir()):
+    if not utils.is_dir_nonempty(const.IMAGE_DIR):
         utils.ui.echo(
             get_string("act_err_image_empty").format(dir=const.IMAGE_DIR.name)
         )
@@ -634,12 +670,13 @@ def flash_full_firmware(
     ensure_loader_file()
 
     if not skip_reset_edl:
-        width = utils.ui.get_term_width()
-        utils.ui.echo("\n" + "=" * width)
-        utils.ui.echo(get_string("act_warn_overwrite_1"))
-        utils.ui.echo(get_string("act_warn_overwrite_2"))
-        utils.ui.echo(get_string("act_warn_overwrite_3"))
-        utils.ui.echo("=" * width + "\n")
+        utils.ui.banner(
+            [
+                get_string("act_warn_overwrite_1"),
+                get_string("act_warn_overwrite_2"),
+                get_string("act_warn_overwrite_3"),
+            ]
+        )
 
         choice = ""
         while choice not in ["y", "n"]:
@@ -649,42 +686,49 @@ def flash_full_firmware(
             utils.ui.echo(get_string("act_op_cancel"))
             return
 
-    _prepare_flash_files(skip_dp)
-
-    raw_xmls, patch_xmls = _select_flash_xmls(skip_dp)
+    # Copying the outputs does not touch the device, so the file copies run
+    # while the device is being switched into EDL mode and waited for. The
+    # worker only copies; all messages are printed from this thread. Leaving
+    # the pool block joins the copy even when the EDL setup fails.
+    copy_plan = _plan_flash_copy(skip_dp)
 
     utils.ui.echo(get_string("act_flash_step1"))
 
-    with dev.edl_session(
-        load_programmer=False,
-        auto_reset=not skip_reset,
-        reset_msg_key="act_reset_sys",
-        skip_msg_key="act_skip_final_reset",
-        pre_sleep=5,
-    ) as port:
-        try:
-            dev.edl.flash_rawprogram(
-                port, const.EDL_LOADER_FILE, "UFS", raw_xmls, patch_xmls
-            )
-        except Exception as e:
-            utils.ui.error(get_string("act_err_main_flash").format(e=e))
-            utils.ui.error(
-                get_string("err_detailed_traceback") + traceback.format_exc()
-            )
-            utils.ui.echo(get_string("act_warn_unstable"))
-            raise
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        copy_future = pool.submit(utils.copy_files, _flash_copy_jobs(copy_plan))
+        with dev.edl_session(
+            load_programmer=False,
+            auto_reset=not skip_reset,
+            reset_msg_key="act_reset_sys",
+            skip_msg_key="act_skip_final_reset",
+            pre_sleep=5,
+        ) as port:
+            _report_flash_copy(copy_plan, copy_future.result())
+            raw_xmls, patch_xmls = _select_flash_xmls(skip_dp)
 
-        utils.ui.echo(get_string("act_flash_step2"))
-        if not skip_dp:
             try:
-                (const.IMAGE_DIR / "devinfo.img").unlink(missing_ok=True)
-                (const.IMAGE_DIR / "persist.img").unlink(missing_ok=True)
-                utils.ui.echo(get_string("act_removed_temp_imgs"))
-            except OSError as e:
-                utils.ui.error(get_string("act_err_clean_imgs").format(e=e))
-
-        if not skip_reset:
-            utils.ui.echo(get_string("act_flash_step3"))
+                dev.edl.flash_rawprogram(
+                    port, const.EDL_LOADER_FILE, "UFS", raw_xmls, patch_xmls
+                )
+            except Exception as e:
+                utils.ui.error(get_string("act_err_main_flash").format(e=e))
+                utils.ui.error(
+                    get_string("err_detailed_traceback") + traceback.format_exc()
+                )
+                utils.ui.echo(get_string("act_warn_unstable"))
+                raise
+
+            utils.ui.echo(get_string("act_flash_step2"))
+            if not skip_dp:
+                try:
+                    (const.IMAGE_DIR / "devinfo.img").unlink(missing_ok=True)
+                    (const.IMAGE_DIR / "persist.img").unlink(missing_ok=True)
+                    utils.ui.echo(get_string("act_removed_temp_imgs"))
+                except OSError as e:
+                    utils.ui.error(get_string("act_err_clean_imgs").format(e=e))
+
+            if not skip_reset:
+                utils.ui.echo(get_string("act_flash_step3"))
 
     if not skip_reset:
         utils.ui.echo(get_string("act_flash_finish"))
@@ -1,4 +1,5 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
@@ -10,9 +11,15 @@ from ..menu import TerminalMenu
 from ..patch.avb import (
     _apply_hash_footer,
     extract_image_avb_info,
+    prefetch_avb_info,
     rebuild_vbmeta_with_chained_images,
 )
-from ..patch.region import detect_country_codes, edit_vendor_boot, patch_country_codes
+from ..patch.region import (
+    convert_vendor_boot,
+    detect_country_codes,
+    edit_vendor_boot,
+    patch_country_codes,
+)
 from . import edl
 
 
@@ -47,24 +54,32 @@ def convert_region_images(
     vbmeta_bak = const.BASE_DIR / const.FN_VBMETA_BAK
 
     try:
-        shutil.copy(vendor_boot_src, vendor_boot_bak)
-        shutil.copy(vbmeta_src, vbmeta_bak)
+        utils.copy_file(vendor_boot_src, vendor_boot_bak)
+        utils.copy_file(vbmeta_src, vbmeta_bak)
         on_log(get_string("act_backup_complete"))
     except (IOError, OSError) as e:
         raise IOError(get_string("act_err_copy_input").format(e=e))
 
-    on_log(get_string("act_start_conv"))
-    edit_vendor_boot(str(vendor_boot_bak), target_region=target_region)
+    # avbtool only reads the untouched backups, so let both reads run while
+    # the patched copy is being written. The worker only caches avbtool's
+    # output; parsing and its log lines stay on this thread.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        info_future = pool.submit(prefetch_avb_info, [vendor_boot_bak, vbmeta_bak])
+
+        on_log(get_string("act_start_conv"))
+        vendor_boot_prc = const.BASE_DIR / const.FN_VENDOR_BOOT_PRC
+        changed = convert_vendor_boot(str(vendor_boot_bak), target_region=target_region)
 
-    vendor_boot_prc = const.BASE_DIR / const.FN_VENDOR_BOOT_PRC
-    on_log(get_string("act_verify_conv"))
-    if not vendor_boot_prc.exists():
-        raise FileNotFoundError(get_string("act_err_vb_prc_not_created"))
-    on_log(get_string("act_conv_success"))
+        on_log(get_string("act_verify_conv"))
+        if not vendor_boot_prc.exists():
+            raise FileNotFoundError(get_string("act_err_vb_prc_not_created"))
+        on_log(get_string("act_conv_success"))
 
-    on_log(get_string("act_extract_info"))
-    vendor_boot_info = extract_image_avb_info(vendor_boot_bak)
-    on_log(get_string("act_info_extracted"))
+        on_log(get_string("act_extract_info"))
+        info_future.result()
+        vendor_boot_info = extract_image_avb_info(vendor_boot_bak)
+        vbmeta_info = extract_image_avb_info(vbmeta_bak)
+        on_log(get_string("act_info_extracted"))
 
     if device_model and not dev.skip_adb:
         device_model = device_model.replace(" ", "")
@@ -83,33 +98,39 @@ def convert_region_images(
             on_log(get_string("act_warn_fp_missing").format(key=fingerprint_key))
             on_log(get_string("act_skip_val"))
 
-    on_log(get_string("act_add_footer_vb"))
-
-    for key in ["partition_size", "name", "rollback", "salt", "algorithm"]:
-        if key not in vendor_boot_info:
-            if key == "partition_size" and "data_size" in vendor_boot_info:
-                vendor_boot_info["partition_size"] = vendor_boot_info["data_size"]
-            else:
-                raise KeyError(
-                    get_string("img_err_missing_key").format(
-                        key=key, name=vendor_boot_bak.name
+    if changed:
+        on_log(get_string("act_add_footer_vb"))
+
+        for key in ["partition_size", "name", "rollback", "salt", "algorithm"]:
+            if key not in vendor_boot_info:
+                if key == "partition_size" and "data_size" in vendor_boot_info:
+                    vendor_boot_info["partition_size"] = vendor_boot_info["data_size"]
+                else:
+                    raise KeyError(
+                        get_string("img_err_missing_key").format(
+                            key=key, name=vendor_boot_bak.name
+                        )
                     )
-                )
 
-    _apply_hash_footer(vendor_boot_prc, vendor_boot_info, None)
+        _apply_hash_footer(vendor_boot_prc, vendor_boot_info, None)
+    else:
+        # Nothing was patched, so the copy still carries the original footer,
+        # which is exactly what add_hash_footer would write from this info.
+        on_log(get_string("act_keep_footer_vb"))
 
     vbmeta_img = const.BASE_DIR / const.FN_VBMETA
     rebuild_vbmeta_with_chained_images(
         output_path=vbmeta_img,
         original_vbmeta_path=vbmeta_bak,
         chained_images=[vendor_boot_prc],
+        vbmeta_info=vbmeta_info,
     )
     on_log("")
 
     on_log(get_string("act_finalize"))
     on_log(get_string("act_rename_final"))
     final_vendor_boot = const.BASE_DIR / const.FN_VENDOR_BOOT
-    shutil.move(const.BASE_DIR / const.FN_VENDOR_BOOT_PRC, final_vendor_boot)
+    utils.move_file(const.BASE_DIR / const.FN_VENDOR_BOOT_PRC, final_vendor_boot)
 
     final_images = [final_vendor_boot, const.BASE_DIR / const.FN_VBMETA]
 
@@ -117,7 +138,9 @@ def convert_region_images(
     utils.move_existing_files(final_images, const.OUTPUT_DIR)
 
     on_log(get_string("act_move_backup").format(dir=const.BACKUP_DIR.name))
-    utils.move_existing_files(const.BASE_DIR.glob("*.bak.img"), const.BACKUP_DIR)
+    utils.move_existing_files(
+        list(utils._iter_matching(const.BASE_DIR, ("*.bak.img",))), const.BACKUP_DIR
+    )
     on_log("")
 
     width = utils.ui.get_term_width()
@@ -160,18 +183,18 @@ def edit_devinfo_persist(
         return None
 
     if devinfo_img_src.exists():
-        shutil.copy(devinfo_img_src, devinfo_img)
+        utils.copy_file(devinfo_img_src, devinfo_img)
     if persist_img_src.exists():
-        shutil.copy(persist_img_src, persist_img)
+        utils.copy_file(persist_img_src, persist_img)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_critical_dir = const.BASE_DIR / f"backup_critical_{timestamp}"
     backup_critical_dir.mkdir(exist_ok=True)
 
     if devinfo_img.exists():
-        shutil.copy(devinfo_img, backup_critical_dir)
+        utils.copy_file(devinfo_img, backup_critical_dir / devinfo_img.name)
     if persist_img.exists():
-        shutil.copy(persist_img, backup_critical_dir)
+        utils.copy_file(persist_img, backup_critical_dir / persist_img.name)
     on_log(get_string("act_files_backed_up").format(dir=backup_critical_dir.name))
 
     on_log(get_string("act_clean_dir").format(dir=const.OUTPUT_DP_DIR.name))
@@ -250,9 +273,9 @@ def edit_devinfo_persist(
     modified_persist = const.BASE_DIR / "persist_modified.img"
 
     if modified_devinfo.exists():
-        shutil.move(modified_devinfo, const.OUTPUT_DP_DIR / const.FN_DEVINFO)
+        utils.move_file(modified_devinfo, const.OUTPUT_DP_DIR / const.FN_DEVINFO)
     if modified_persist.exists():
-        shutil.move(modified_persist, const.OUTPUT_DP_DIR / const.FN_PERSIST)
+        utils.move_file(modified_persist, const.OUTPUT_DP_DIR / const.FN_PERSIST)
 
     on_log(get_string("act_dp_moved").format(dir=const.OUTPUT_DP_DIR.name))
 
@@ -318,7 +341,7 @@ def rescue_after_ota(
             continue
 
         dest_vb = const.OUTPUT_DIR / f"{vb_target}.img"
-        shutil.move(prc_temp, dest_vb)
+        utils.move_file(prc_temp, dest_vb)
         patched_map[vb_target] = dest_vb
 
         on_log(get_string("rescue_remaking_vbmeta").format(slot=slot))
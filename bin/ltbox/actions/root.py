@@ -230,7 +230,7 @@ class InitBootRootStrategy(ConfigurableRootStrategy):
         init_boot_source = work_dir / self.image_name
         init_boot_backup = const.BASE_DIR / self.backup_name
         if init_boot_source.exists() and not init_boot_backup.exists():
-            shutil.copy(init_boot_source, init_boot_backup)
+            utils.copy_file(init_boot_source, init_boot_backup)
 
         if not all((self.staging_dir / name).exists() for name in self.payload_files):
             if not self.download_resources(lkm_kernel_version):
@@ -266,10 +266,10 @@ class InitBootRootStrategy(ConfigurableRootStrategy):
         )
 
         final_boot = output_dir / self.image_name
-        shutil.move(patched_boot, final_boot)
+        utils.move_file(patched_boot, final_boot)
 
         if patched_vbmeta_path.exists():
-            shutil.move(patched_vbmeta_path, output_dir / const.FN_VBMETA)
+            utils.move_file(patched_vbmeta_path, output_dir / const.FN_VBMETA)
 
         return final_boot
 
@@ -314,7 +314,7 @@ class GkiRootStrategy(ConfigurableRootStrategy):
     ) -> Path:
         process_boot_image_avb(patched_boot, gki=True, backup_dir=backup_source_dir)
         final_boot = output_dir / self.image_name
-        shutil.move(patched_boot, final_boot)
+        utils.move_file(patched_boot, final_boot)
         return final_boot
 
 
@@ -364,8 +364,7 @@ class MagiskRootStrategy(InitBootRootStrategy):
             return False
 
         manager_path = const.TOOLS_DIR / "manager.apk"
-        if manager_path.exists():
-            manager_path.unlink()
+        manager_path.unlink(missing_ok=True)
         shutil.copy(apk_path, manager_path)
         return True
 
@@ -435,7 +434,7 @@ class LkmRootStrategy(InitBootRootStrategy):
         utils.ui.echo(msg_default)
         utils.ui.echo("-" * width)
 
-        val = input(get_string("prompt_input_arrow")).strip()
+        val = utils.ui.prompt(get_string("prompt_input_arrow")).strip()
         if not val:
             return default_id
         return val
@@ -631,13 +630,15 @@ def _patch_root_image_from_image_folder(
             f"'{const.FN_BOOT}'", f"'{const.FN_INIT_BOOT}' and '{const.FN_VBMETA}'"
         )
 
+    if gki:
+        downloader.prefetch_gki_releases()
     utils.wait_for_files(const.IMAGE_DIR, strategy.required_files, prompt)
 
     for fname in strategy.required_files:
         src = const.IMAGE_DIR / fname
         dst = const.BASE_DIR / fname
         try:
-            shutil.copy(src, dst)
+            utils.copy_file(src, dst)
             utils.ui.echo(get_string("act_copy_boot").format(name=src.name))
         except (IOError, OSError) as e:
             utils.ui.error(get_string("act_err_copy_boot").format(name=src.name, e=e))
@@ -649,27 +650,26 @@ def _patch_root_image_from_image_folder(
         raise ToolError(msg)
 
     utils.ui.echo(get_string("act_backup_boot"))
-    shutil.copy(
+    utils.copy_file(
         const.BASE_DIR / strategy.image_name, const.BASE_DIR / strategy.backup_name
     )
     if not gki:
-        shutil.copy(
+        utils.copy_file(
             const.BASE_DIR / const.FN_VBMETA, const.BASE_DIR / const.FN_VBMETA_BAK
         )
 
     patched_boot_path = None
     with utils.temporary_workspace(const.WORK_DIR):
-        shutil.copy(
+        utils.move_file(
             const.BASE_DIR / strategy.image_name, const.WORK_DIR / strategy.image_name
         )
-        (const.BASE_DIR / strategy.image_name).unlink()
 
         if not gki:
             (const.BASE_DIR / const.FN_VBMETA).unlink()
 
         if isinstance(strategy, LkmRootStrategy) and not lkm_kernel_version:
             utils.ui.echo(get_string("err_req_kernel_ver_lkm"))
-            lkm_kernel_version = input(
+            lkm_kernel_version = utils.ui.prompt(
                 get_string("prompt_enter_kernel_version")
             ).strip()
             if not lkm_kernel_version:
@@ -692,9 +692,10 @@ def _patch_root_image_from_image_folder(
         utils.ui.echo(
             get_string("act_move_root_backup").format(dir=const.BACKUP_DIR.name)
         )
-        const.BACKUP_DIR.mkdir(exist_ok=True)
-        for bak_file in const.BASE_DIR.glob("*.bak.img"):
-            shutil.move(bak_file, const.BACKUP_DIR / bak_file.name)
+        utils.move_existing_files(
+            list(utils._iter_matching(const.BASE_DIR, ("*.bak.img",))),
+            const.BACKUP_DIR,
+        )
         utils.ui.echo("")
 
         width = utils.ui.get_term_width()
@@ -890,16 +891,16 @@ def _dump_and_generate_root_image(
             utils.ui.echo(
                 get_string("act_backup_boot_root").format(dir=strategy.backup_dir.name)
             )
-            shutil.copy(dumped_main, backup_main)
+            utils.copy_file(dumped_main, backup_main)
             utils.ui.echo(get_string("act_temp_backup_avb"))
-            shutil.copy(dumped_main, base_main_bak)
+            utils.copy_file(dumped_main, base_main_bak)
 
             if not gki:
-                shutil.copy(
+                utils.copy_file(
                     const.WORKING_BOOT_DIR / const.FN_VBMETA,
                     strategy.backup_dir / const.FN_VBMETA,
                 )
-                shutil.copy(
+                utils.copy_file(
                     const.WORKING_BOOT_DIR / const.FN_VBMETA,
                     const.BASE_DIR / const.FN_VBMETA_BAK,
                 )
@@ -1180,7 +1181,7 @@ def sign_and_flash_twrp(dev: device.DeviceController) -> None:
 
             backup_recovery = const.BACKUP_DIR / f"recovery{suffix}.img"
             const.BACKUP_DIR.mkdir(exist_ok=True)
-            shutil.copy(dumped_recovery, backup_recovery)
+            utils.copy_file(dumped_recovery, backup_recovery)
             utils.ui.echo(get_string("act_backup_recovery_ok"))
 
         utils.ui.echo(get_string("act_sign_twrp_start"))
@@ -1197,7 +1198,7 @@ def sign_and_flash_twrp(dev: device.DeviceController) -> None:
             raise KeyError(f"Unknown key: {pubkey}")
 
         final_twrp = out_dir / twrp_name
-        shutil.copy(twrp_src, final_twrp)
+        utils.copy_file(twrp_src, final_twrp)
 
         subprocess.run(
             [
@@ -1,11 +1,12 @@
 import shutil
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .. import constants as const
 from .. import utils
-from ..crypto import decrypt_file
+from ..crypto import decrypt_file_quiet
 from ..i18n import get_string
 
 
@@ -52,35 +53,52 @@ def _clean_existing_files(files: List[Path], log_msg: str, prefix: str = "") ->
     if not files:
         return
     utils.ui.info(f"{prefix}{log_msg}")
-    for f in files:
-        try:
-            f.unlink()
-        except OSError as e:
+    for f, e in utils.unlink_files(files):
+        if e is not None:
             utils.ui.info(
                 f"{prefix}{get_string('xml_err_delete_fail').format(name=f.name, e=e)}"
             )
 
 
-def _decrypt_files(x_files: List[Path], target_dir: Path) -> int:
+def _decrypt_one(x_file: Path, xml_file: Path) -> Tuple[bool, str, bool]:
+    """Returns (ok, message, is_error) for one file; prints nothing."""
+    try:
+        ok, message = decrypt_file_quiet(str(x_file), str(xml_file))
+        return ok, message, False
+    except (OSError, ValueError, KeyError) as e:
+        error = get_string("img_xml_decrypt_err").format(name=x_file.name, e=e)
+        return False, error, True
+
+
+def _decrypt_files(x_files: List[Path], target_dir: Path, max_workers: int = 8) -> int:
+    """Decrypts x_files into target_dir on a small thread pool.
+
+    Workers only decrypt; their messages are reported in input order from
+    the calling thread, batched into a single console write.
+    """
+    xml_files = [target_dir / x_file.with_suffix(".xml").name for x_file in x_files]
+    if len(x_files) <= 1:
+        results = list(map(_decrypt_one, x_files, xml_files))
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(x_files))) as pool:
+            results = list(pool.map(_decrypt_one, x_files, xml_files))
+
     success_count = 0
-    for x_file in x_files:
-        xml_file = target_dir / x_file.with_suffix(".xml").name
-        try:
-            if decrypt_file(str(x_file), str(xml_file)):
-                utils.ui.info(
-                    get_string("img_xml_decrypt_ok").format(
-                        src=x_file.name, dst=xml_file.name
-                    )
+    for x_file, xml_file, (ok, message, is_error) in zip(x_files, xml_files, results):
+        if is_error:
+            utils.ui.error(message)
+            continue
+        utils.ui.buffer(message)
+        if ok:
+            utils.ui.buffer(
+                get_string("img_xml_decrypt_ok").format(
+                    src=x_file.name, dst=xml_file.name
                 )
-                success_count += 1
-            else:
-                utils.ui.info(
-                    get_string("img_xml_decrypt_fail").format(name=x_file.name)
-                )
-        except (OSError, ValueError) as e:
-            utils.ui.error(
-                get_string("img_xml_decrypt_err").format(name=x_file.name, e=e)
             )
+            success_count += 1
+        else:
+            utils.ui.buffer(get_string("img_xml_decrypt_fail").format(name=x_file.name))
+    utils.ui.flush()
     return success_count
 
 
@@ -89,9 +107,7 @@ def _move_files(src_files: List[Path], target_dir: Path) -> int:
     for file in src_files:
         out_file = target_dir / file.name
         try:
-            if out_file.exists():
-                out_file.unlink()
-            shutil.move(str(file), str(out_file))
+            utils.move_file(file, out_file)
             utils.ui.info(get_string("img_xml_moved").format(name=file.name))
             success_count += 1
         except OSError as e:
@@ -99,12 +115,28 @@ def _move_files(src_files: List[Path], target_dir: Path) -> int:
     return success_count
 
 
+def _split_x_and_xml(files: List[Path]) -> Tuple[List[Path], List[Path]]:
+    x_files = [f for f in files if f.suffix.lower() == ".x"]
+    xml_files = [f for f in files if f.suffix.lower() == ".xml"]
+    return x_files, xml_files
+
+
+def _has_rawprogram_xml() -> bool:
+    return any(
+        any(utils._iter_matching(d, ("rawprogram*.xml",)))
+        for d in (const.IMAGE_DIR, const.OUTPUT_XML_DIR)
+    )
+
+
 def auto_decrypt_if_needed() -> None:
-    x_files = list(const.IMAGE_DIR.glob("rawprogram*.x"))
+    x_files, xml_files = _split_x_and_xml(
+        list(
+            utils._iter_matching(const.IMAGE_DIR, ("rawprogram*.x", "rawprogram*.xml"))
+        )
+    )
     if not x_files:
         return
 
-    xml_files = list(const.IMAGE_DIR.glob("rawprogram*.xml"))
     if xml_files:
         _clean_existing_files(xml_files, get_string("xml_cleaning_pollution"))
         width = utils.ui.get_term_width()
@@ -124,19 +156,12 @@ def ensure_xml_files() -> None:
     auto_decrypt_if_needed()
 
     def _check_xml_ready(path: Path, _: Optional[List[str]]) -> bool:
-        if list(const.IMAGE_DIR.glob("rawprogram*.xml")) or list(
-            const.OUTPUT_XML_DIR.glob("rawprogram*.xml")
-        ):
+        if _has_rawprogram_xml():
             return True
 
         auto_decrypt_if_needed()
 
-        if list(const.IMAGE_DIR.glob("rawprogram*.xml")) or list(
-            const.OUTPUT_XML_DIR.glob("rawprogram*.xml")
-        ):
-            return True
-
-        return False
+        return _has_rawprogram_xml()
 
     utils._wait_for_resource(
         const.IMAGE_DIR, _check_xml_ready, get_string("act_prompt_image"), None
@@ -156,16 +181,16 @@ def decrypt_x_files() -> None:
 
     utils.ui.info(get_string("img_xml_scan"))
 
-    x_files = list(const.IMAGE_DIR.glob("*.x"))
+    x_files, xml_files = _split_x_and_xml(
+        list(utils._iter_matching(const.IMAGE_DIR, ("*.x", "*.xml")))
+    )
 
     if x_files:
         utils.ui.info(get_string("xml_check_conflicts"))
-        existing_xmls = list(const.IMAGE_DIR.glob("*.xml"))
         _clean_existing_files(
-            existing_xmls, get_string("xml_cleaning_clean_decrypt"), prefix="  "
+            xml_files, get_string("xml_cleaning_clean_decrypt"), prefix="  "
         )
-
-    xml_files = list(const.IMAGE_DIR.glob("*.xml"))
+        xml_files = [f for f in xml_files if f.exists()]
 
     processed_files = False
 
@@ -328,18 +353,23 @@ def _ensure_rawprogram_save_persist(output_dir: Path) -> Path:
 
 def _patch_xml_for_wipe(xml_path: Path, wipe: int) -> None:
     try:
-        rp = RawProgramXml(xml_path)
-
         if wipe == 0:
             utils.ui.info(get_string("img_xml_nowipe"))
+            rp = RawProgramXml(xml_path)
+            modified = False
             for prog in rp.programs:
                 label = prog.label.lower()
                 if label.startswith("metadata") or label.startswith("userdata"):
-                    prog.filename = ""
+                    if prog.filename:
+                        prog.filename = ""
+                        modified = True
+
+            # Only write the file back when an entry was actually blanked.
+            if modified:
+                rp.save(xml_path)
         else:
             utils.ui.info(get_string("img_xml_wipe"))
 
-        rp.save(xml_path)
         utils.ui.info(get_string("img_xml_patch_ok"))
     except (OSError, ET.ParseError) as e:
         utils.ui.error(get_string("img_xml_patch_err").format(e=e))
@@ -349,17 +379,15 @@ def _patch_xml_for_wipe(xml_path: Path, wipe: int) -> None:
 def _cleanup_garbage_xmls(output_dir: Path) -> None:
     utils.ui.info(get_string("img_xml_cleanup"))
 
-    files_to_delete = []
-    for f in output_dir.glob("*.xml"):
-        if _is_garbage_file(f):
-            files_to_delete.append(f)
+    files_to_delete = [
+        f for f in utils._iter_matching(output_dir, ("*.xml",)) if _is_garbage_file(f)
+    ]
 
     if files_to_delete:
-        for f in files_to_delete:
-            try:
-                f.unlink()
+        for f, e in utils.unlink_files(files_to_delete):
+            if e is None:
                 utils.ui.info(get_string("img_xml_deleted").format(name=f.name))
-            except OSError as e:
+            else:
                 utils.ui.info(get_string("img_xml_del_err").format(name=f.name, e=e))
     else:
         utils.ui.info(get_string("img_xml_no_del"))
@@ -419,7 +447,7 @@ def _create_write_xml(
 def modify_xml(wipe: int = 0, skip_dp: bool = False) -> None:
     utils.ui.info(get_string("act_start_xml_mod"))
 
-    if not const.OUTPUT_XML_DIR.exists() or not any(const.OUTPUT_XML_DIR.iterdir()):
+    if not utils.is_dir_nonempty(const.OUTPUT_XML_DIR):
         utils.ui.error(
             get_string("act_err_no_xml_output_folder").format(
                 dir=const.OUTPUT_XML_DIR.name
@@ -1,6 +1,6 @@
 import hashlib
 import struct
-from typing import Any
+from typing import Any, Tuple
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
@@ -22,39 +22,48 @@ def generate(salt: bytes) -> bytes:
     return PBKDF1(PASSWORD, salt, 32, hashlib.sha256, 1000)
 
 
-def decrypt_file(fi_path: str, fo_path: str) -> bool:
-    try:
-        with open(fi_path, "rb") as fi:
-            iv = fi.read(16)
-            salt = fi.read(16)
-            encrypted_body = fi.read()
+def decrypt_file_quiet(fi_path: str, fo_path: str) -> Tuple[bool, str]:
+    """Decrypts fi_path into fo_path without printing.
+
+    Returns (ok, message) for the caller to report; read and decode errors
+    are raised.
+    """
+    with open(fi_path, "rb") as fi:
+        iv = fi.read(16)
+        salt = fi.read(16)
+        encrypted_body = fi.read()
+
+    key = generate(salt)
 
-        key = generate(salt)
+    cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
+    decryptor = cipher.decryptor()
+    plain = decryptor.update(encrypted_body) + decryptor.finalize()
 
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
-        decryptor = cipher.decryptor()
-        plain = decryptor.update(encrypted_body) + decryptor.finalize()
+    original_size = struct.unpack("<q", plain[0:8])[0]
+    signature = plain[8:16]
+    if signature != b"\xcf\x06\x05\x04\x03\x02\x01\xfc":
+        return False, get_string("img_decrypt_broken")
 
-        original_size = struct.unpack("<q", plain[0:8])[0]
-        signature = plain[8:16]
-        if signature != b"\xcf\x06\x05\x04\x03\x02\x01\xfc":
-            utils.ui.echo(get_string("img_decrypt_broken"))
-            return False
+    body = plain[16 : 16 + original_size]
+    digest = hashlib.sha256(body).digest()
+    if digest != plain[16 + original_size : 16 + original_size + 32]:
+        return False, get_string("img_decrypt_broken")
 
-        body = plain[16 : 16 + original_size]
-        digest = hashlib.sha256(body).digest()
-        if digest != plain[16 + original_size : 16 + original_size + 32]:
-            utils.ui.echo(get_string("img_decrypt_broken"))
-            return False
+    with open(fo_path, "wb") as fo:
+        fo.write(body)
 
-        with open(fo_path, "wb") as fo:
-            fo.write(body)
+    return (
+        True,
+        f"{get_string('img_decrypt_success')} {original_size} {get_string('img_decrypt_bytes')}",
+    )
 
-        utils.ui.echo(
-            f"{get_string('img_decrypt_success')} {original_size} {get_string('img_decrypt_bytes')}"
-        )
-        return True
 
+def decrypt_file(fi_path: str, fo_path: str) -> bool:
+    try:
+        ok, message = decrypt_file_quiet(fi_path, fo_path)
     except (OSError, ValueError, KeyError) as e:
         utils.ui.error(get_string("img_decrypt_error").format(path=fi_path, e=e))
         return False
+
+    utils.ui.echo(message)
+    return ok
@@ -4,7 +4,7 @@ import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import adbutils
 import serial.tools.list_ports
@@ -17,6 +17,9 @@ from .i18n import get_string
 from .ui import ui
 
 
+_GETPROP_LINE_RE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]\r?$", re.MULTILINE)
+
+
 def _default_usb_port_hint() -> Callable[[], None]:
     return lambda: ui.warn(get_string("device_usb_port_hint"))
 
@@ -89,6 +92,7 @@ class AdbManager(BaseDeviceManager):
                 ]
             )
         else:
+            ui.flush()
             print(get_string("device_wait_adb_loop") + "...", end="\r")
 
         def _check_adb():
@@ -207,6 +211,21 @@ class AdbManager(BaseDeviceManager):
     def shell(self, cmd: str) -> str:
         return self._with_device(lambda d: d.shell(cmd)) or ""
 
+    def get_props(self, keys: List[str]) -> Dict[str, str]:
+        """Reads several properties with a single `getprop` round-trip."""
+        try:
+            output = self._with_device(lambda d: d.shell("getprop")) or ""
+        except Exception as e:
+            raise DeviceConnectionError(
+                get_string("device_err_wait_adb").format(e=e), e
+            )
+        wanted = set(keys)
+        return {
+            key: value
+            for key, value in _GETPROP_LINE_RE.findall(output)
+            if key in wanted
+        }
+
     def force_kill_server(self):
         self._force_kill_process("adb.exe")
 
@@ -516,6 +535,8 @@ class DeviceController:
     ):
         self._usb_port_hint_shown = False
         self._skip_adb = skip_adb
+        self._cached_slot: Optional[str] = None
+        self._cached_model: Optional[str] = None
 
         self.adb = (
             adb_manager
@@ -539,6 +560,12 @@ class DeviceController:
 
     def reset_task_state(self) -> None:
         self._usb_port_hint_shown = False
+        self.invalidate_device_info()
+
+    def invalidate_device_info(self) -> None:
+        """Drops the cached slot and model, e.g. after the device left ADB."""
+        self._cached_slot = None
+        self._cached_model = None
 
     def _maybe_warn_usb_port_hint(self) -> None:
         if self._usb_port_hint_shown:
@@ -555,15 +582,38 @@ class DeviceController:
         self._skip_adb = value
         self.adb.skip_adb = value
 
+    def prefetch_device_info(self) -> None:
+        """Fills the slot and model caches from one getprop call."""
+        if self.skip_adb or (self._cached_slot and self._cached_model):
+            return
+        try:
+            props = self.adb.get_props(["ro.boot.slot_suffix", "ro.product.model"])
+        except DeviceConnectionError:
+            return
+
+        slot = props.get("ro.boot.slot_suffix")
+        if self._cached_slot is None and slot in ["_a", "_b"]:
+            self._cached_slot = slot
+        model = props.get("ro.product.model")
+        if self._cached_model is None and model:
+            self._cached_model = model
+
+    def get_model(self) -> Optional[str]:
+        if self._cached_model is None:
+            self._cached_model = self.adb.get_model()
+        return self._cached_model
+
     def detect_active_slot(self) -> Optional[str]:
+        if self._cached_slot is None:
+            self._cached_slot = self._read_active_slot()
+        return self._cached_slot
+
+    def _read_active_slot(self) -> Optional[str]:
         slot = self.adb.get_slot_suffix()
         if slot:
             return slot
 
-        width = ui.get_term_width()
-        ui.echo("\n" + "=" * width)
-        ui.echo(get_string("act_manual_fastboot"))
-        ui.echo("=" * width + "\n")
+        ui.banner([get_string("act_manual_fastboot")])
 
         self.ensure_fastboot_mode()
         return self.fastboot.get_slot_suffix()
@@ -581,6 +631,7 @@ class DeviceController:
         self.fastboot.wait_for_device()
 
     def ensure_edl_mode(self) -> None:
+        self.invalidate_device_info()
         if self.edl.check_device(silent=True):
             ui.info(get_string("device_already_edl"))
             return
@@ -590,12 +641,13 @@ class DeviceController:
             ui.info(get_string("device_edl_setup_title"))
             self.adb.reboot("edl")
             ui.info(get_string("device_wait_10s_edl"))
-            time.sleep(10)
+            # Poll for the 9008 port instead of sleeping blindly; most devices
+            # re-enumerate well before the old fixed 10s delay ran out.
+            utils.wait_for_condition(
+                lambda: self.edl.check_device(silent=True), interval=0.5, timeout=10
+            )
         else:
-            width = ui.get_term_width()
-            ui.echo("\n" + "=" * width)
-            ui.echo(get_string("act_manual_edl"))
-            ui.echo("=" * width + "\n")
+            ui.banner([get_string("act_manual_edl")])
 
     def setup_edl_connection(self) -> str:
         self.ensure_edl_mode()
@@ -3,9 +3,11 @@ import re
 import shutil
 import sys
 import tarfile
+import threading
 import zipfile
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests  # type: ignore[import-untyped]
 
@@ -27,6 +29,33 @@ def _get_owner_repo(repo_url: str) -> str:
     return repo_url
 
 
+_WILDKERNELS_REPO = "wildkernels/gki_kernelsu_susfs"
+
+_release_prefetch: Dict[str, "Future[List[Dict[str, Any]]]"] = {}
+
+
+def _fetch_release_list(owner_repo: str) -> List[Dict[str, Any]]:
+    releases_url = f"https://api.github.com/repos/{owner_repo}/releases"
+    response = requests.get(releases_url, params={"per_page": 10}, timeout=15)
+    response.raise_for_status()
+
+    try:
+        payload = response.json()
+    except ValueError:
+        return []
+    return payload if isinstance(payload, list) else []
+
+
+def _get_release_list(owner_repo: str) -> List[Dict[str, Any]]:
+    prefetched = _release_prefetch.pop(owner_repo.lower(), None)
+    if prefetched is not None:
+        try:
+            return prefetched.result()
+        except Exception as e:
+            utils.ui.warn(get_string("dl_gki_prefetch_failed").format(e=e))
+    return _fetch_release_list(owner_repo)
+
+
 def _extract_zip_member(
     zip_file: zipfile.ZipFile, member: zipfile.ZipInfo, target_path: Path
 ) -> None:
@@ -69,8 +98,7 @@ def download_resource(url: str, dest_path: Path, show_progress: bool = True) ->
     except (requests.RequestException, OSError) as e:
         msg_err = get_string("dl_download_failed").format(url=url, error=e)
         utils.ui.error(msg_err)
-        if dest_path.exists():
-            dest_path.unlink()
+        dest_path.unlink(missing_ok=True)
         raise ToolError(get_string("dl_err_download_tool").format(name=dest_path.name))
 
 
@@ -126,20 +154,10 @@ def _download_github_asset(
 
     try:
         release_data = None
-        if owner_repo.lower() == "wildkernels/gki_kernelsu_susfs" and (
+        if owner_repo.lower() == _WILDKERNELS_REPO and (
             not tag or tag.lower() == "latest"
         ):
-            releases_url = f"https://api.github.com/repos/{owner_repo}/releases"
-            response = requests.get(releases_url, params={"per_page": 10})
-            response.raise_for_status()
-
-            releases: list[dict] = []
-            try:
-                payload = response.json()
-                if isinstance(payload, list):
-                    releases = payload
-            except ValueError:
-                releases = []
+            releases = _get_release_list(owner_repo)
 
             if releases:
                 first_non_testing_index = None
@@ -214,8 +232,7 @@ def _download_and_move_github_asset(
         repo_url, tag, asset_pattern, target_file.parent
     )
     if downloaded_path.resolve() != target_file.resolve():
-        if target_file.exists():
-            target_file.unlink()
+        target_file.unlink(missing_ok=True)
         shutil.move(str(downloaded_path), str(target_file))
     return target_file
 
@@ -414,8 +431,7 @@ def ensure_platform_tools() -> None:
     except (zipfile.BadZipFile, OSError, IOError) as e:
         msg_err = get_string("dl_platform_failed").format(error=e)
         utils.ui.error(msg_err)
-        if temp_zip_path.exists():
-            temp_zip_path.unlink()
+        temp_zip_path.unlink(missing_ok=True)
         raise ToolError(msg_err)
 
 
@@ -478,8 +494,7 @@ def ensure_openssl() -> None:
         utils.ui.error(get_string("dl_err_openssl_download").format(e=e))
         raise ToolError(get_string("dl_err_openssl_generic"))
     finally:
-        if temp_zip.exists():
-            temp_zip.unlink()
+        temp_zip.unlink(missing_ok=True)
 
 
 def ensure_magiskboot() -> Path:
@@ -499,9 +514,7 @@ def ensure_magiskboot() -> Path:
     )
 
 
-def get_gki_kernel(kernel_version: str, work_dir: Path) -> Path:
-    utils.ui.echo(get_string("dl_gki_downloading"))
-
+def _get_gki_release_source() -> Tuple[str, str]:
     try:
         tag = const.CONF._get_val("wildkernels", "tag", default="latest")
         owner = const.CONF._get_val("wildkernels", "owner")
@@ -511,9 +524,44 @@ def get_gki_kernel(kernel_version: str, work_dir: Path) -> Path:
         owner = const.RELEASE_OWNER
         repo = const.RELEASE_REPO
 
-    if not tag:
-        tag = "latest"
-    repo_ref = f"{owner}/{repo}"
+    return f"{owner}/{repo}", tag or "latest"
+
+
+def _run_release_prefetch(
+    future: "Future[List[Dict[str, Any]]]", owner_repo: str
+) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(_fetch_release_list(owner_repo))
+    except Exception as e:
+        future.set_exception(e)
+
+
+def prefetch_gki_releases() -> None:
+    """Fetches the GKI release list on a background thread.
+
+    Meant to run while the user is still copying images. The result is
+    consumed once by _get_release_list; failures are retried and reported
+    there. The worker is a daemon thread so a pending request never holds
+    up interpreter exit when the user cancels.
+    """
+    repo_ref, tag = _get_gki_release_source()
+    owner_repo = _get_owner_repo(repo_ref)
+    if owner_repo.lower() != _WILDKERNELS_REPO or tag.lower() != "latest":
+        return
+
+    future: "Future[List[Dict[str, Any]]]" = Future()
+    _release_prefetch[owner_repo.lower()] = future
+    threading.Thread(
+        target=_run_release_prefetch, args=(future, owner_repo), daemon=True
+    ).start()
+
+
+def get_gki_kernel(kernel_version: str, work_dir: Path) -> Path:
+    utils.ui.echo(get_string("dl_gki_downloading"))
+
+    repo_ref, tag = _get_gki_release_source()
 
     asset_pattern = f"{re.escape(kernel_version)}.*Normal.*AnyKernel3\\.zip"
 
@@ -580,14 +628,12 @@ def download_nightly_artifacts(
             try:
                 download_resource(candidate_url, candidate_path)
                 if candidate_path != manager_zip:
-                    if manager_zip.exists():
-                        manager_zip.unlink()
+                    manager_zip.unlink(missing_ok=True)
                     shutil.move(candidate_path, manager_zip)
                 manager_downloaded = True
                 break
             except Exception:
-                if candidate_path.exists():
-                    candidate_path.unlink()
+                candidate_path.unlink(missing_ok=True)
                 continue
 
         if not manager_downloaded:
@@ -649,8 +695,7 @@ def download_nightly_artifacts(
                 if ksuinit_downloaded and not download_all_ksuinit:
                     break
             except Exception:
-                if temp_ksuinit_zip.exists():
-                    temp_ksuinit_zip.unlink()
+                temp_ksuinit_zip.unlink(missing_ok=True)
                 continue
 
         if not ksuinit_downloaded:
@@ -663,12 +708,9 @@ def download_nightly_artifacts(
         )
 
     except Exception as e:
-        if manager_zip.exists():
-            manager_zip.unlink()
-        if ksuinit_dest.exists():
-            ksuinit_dest.unlink()
-        if lkm_dest.exists():
-            lkm_dest.unlink()
+        manager_zip.unlink(missing_ok=True)
+        ksuinit_dest.unlink(missing_ok=True)
+        lkm_dest.unlink(missing_ok=True)
         raise e
 
 
@@ -731,8 +773,7 @@ def extract_magisk_libs(apk_path: Path, target_dir: Path) -> None:
 
 
 def download_ksuinit_release(target_path: Path) -> None:
-    if target_path.exists():
-        target_path.unlink()
+    target_path.unlink(missing_ok=True)
 
     owner_repo = _get_owner_repo(f"https://github.com/{const.KSU_APK_REPO}")
     tag = _resolve_release_tag(owner_repo, const.KSU_APK_TAG)
@@ -754,8 +795,7 @@ def download_ksuinit_release(target_path: Path) -> None:
             with zf.open(ksuinit_member) as src, open(target_path, "wb") as dst:
                 shutil.copyfileobj(src, dst)
     finally:
-        if temp_zip.exists():
-            temp_zip.unlink()
+        temp_zip.unlink(missing_ok=True)
 
 
 def get_lkm_kernel_release(target_path: Path, kernel_version: str) -> None:
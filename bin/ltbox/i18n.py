@@ -1,7 +1,8 @@
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 APP_DIR = Path(__file__).parent.resolve()
 LANG_DIR = APP_DIR / "lang"
@@ -59,11 +60,20 @@ def load_lang(lang_code: str = "en"):
             )
             _lang_data = _fallback_data
 
+    _get_raw.cache_clear()
+
+
+@lru_cache(maxsize=512)
+def _get_raw(key: str) -> Optional[str]:
+    return _lang_data.get(key, _fallback_data.get(key))
+
 
 def get_string(key: str, default: str = "") -> str:
     if not _fallback_data:
         load_lang("en")
-    val = _lang_data.get(key, _fallback_data.get(key, default))
+    val = _get_raw(key)
+    if val is None:
+        val = default
     if val:
         return val
 
@@ -1,7 +1,9 @@
 import logging
+import queue
 import sys
 from contextlib import contextmanager
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 
 try:
     import colorama
@@ -24,6 +26,14 @@ class ColoredConsoleFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         msg = super().format(record)
+        if "\n" in msg:
+            return "\n".join(
+                self._colorize(line, record) if line else line
+                for line in msg.split("\n")
+            )
+        return self._colorize(msg, record)
+
+    def _colorize(self, msg: str, record: logging.LogRecord) -> str:
         stripped_msg = msg.lstrip()
 
         if stripped_msg.startswith("[+]"):
@@ -53,9 +63,12 @@ def get_logger() -> logging.Logger:
 
 @contextmanager
 def logging_context(log_filename: Optional[str] = None):
-    handlers_to_remove = []
+    handlers_to_remove: List[logging.Handler] = []
+    listener: Optional[QueueListener] = None
 
-    has_file_handler = any(isinstance(h, logging.FileHandler) for h in _logger.handlers)
+    has_file_handler = any(
+        isinstance(h, (logging.FileHandler, QueueHandler)) for h in _logger.handlers
+    )
 
     try:
         if log_filename and not has_file_handler:
@@ -63,12 +76,22 @@ def logging_context(log_filename: Optional[str] = None):
             file_handler.setFormatter(
                 logging.Formatter("%(asctime)s - %(message)s", datefmt="%H:%M:%S")
             )
-            _logger.addHandler(file_handler)
+            # Disk writes happen on the listener thread; the console handler
+            # stays synchronous so output keeps its order around prompts.
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            queue_handler = QueueHandler(log_queue)
+            _logger.addHandler(queue_handler)
+            handlers_to_remove.append(queue_handler)
             handlers_to_remove.append(file_handler)
 
         yield _logger
 
     finally:
         for handler in handlers_to_remove:
-            handler.close()
             _logger.removeHandler(handler)
+        if listener:
+            listener.stop()
+        for handler in handlers_to_remove:
+            handler.close()
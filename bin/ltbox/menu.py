@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from .i18n import get_string
 from .menu_data import MenuItem
@@ -16,11 +16,11 @@ class TerminalMenu:
         self.title = title
         self.breadcrumbs = breadcrumbs
         self.options: List[Tuple[Optional[str], str, bool]] = []
-        self.valid_keys: List[str] = []
+        self.valid_keys: Set[str] = set()
 
     def add_option(self, key: str, text: str) -> None:
         self.options.append((key, text, True))
-        self.valid_keys.append(key.lower())
+        self.valid_keys.add(key.lower())
 
     def add_label(self, text: str) -> None:
         self.options.append((None, text, False))
@@ -40,12 +40,10 @@ class TerminalMenu:
     def show(self) -> None:
         width = ui.get_term_width()
         ui.clear()
-        ui.echo("\n" + "=" * width)
         display_title = (
             f"{self.breadcrumbs} > {self.title}" if self.breadcrumbs else self.title
         )
-        ui.echo(f"   {display_title}")
-        ui.echo("=" * width + "\n")
+        ui.banner([f"   {display_title}"])
 
         for key, text, is_selectable in self.options:
             if is_selectable:
@@ -60,15 +58,11 @@ class TerminalMenu:
 
     def ask(self, prompt_msg: str, error_msg: str) -> str:
         if questionary:
-            width = ui.get_term_width()
             ui.clear()
-            ui.echo("\n" + "=" * width)
-
             display_title = (
                 f"{self.breadcrumbs} > {self.title}" if self.breadcrumbs else self.title
             )
-            ui.echo(f"   {display_title}")
-            ui.echo("=" * width + "\n")
+            ui.banner([f"   {display_title}"])
 
             choices = []
             for key, text, is_selectable in self.options:
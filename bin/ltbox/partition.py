@@ -26,13 +26,16 @@ def scan_and_decrypt_xmls() -> List[Path]:
                 xml_name = x_file.stem + ".xml"
                 out_path = const.OUTPUT_XML_DIR / xml_name
                 if not out_path.exists():
-                    print(get_string("act_xml_decrypting").format(name=x_file.name))
+                    utils.ui.buffer(
+                        get_string("act_xml_decrypting").format(name=x_file.name)
+                    )
                     if decrypt_file(str(x_file), str(out_path)):
                         xmls.append(out_path)
                     else:
-                        print(
+                        utils.ui.buffer(
                             get_string("act_xml_decrypt_fail").format(name=x_file.name)
                         )
+            utils.ui.flush()
         else:
             print(get_string("img_xml_no_files").format(dir=const.IMAGE_DIR.name))
             print(get_string("act_xml_dump_req"))
@@ -1,13 +1,25 @@
+import mmap
+import os
 import re
-import shutil
+import struct
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .. import constants as const
 from .. import utils
 from ..i18n import get_string
 
+_AVB_FOOTER = struct.Struct("!4s2L3Q")
+_AVB_FOOTER_SIZE = 64
+_AVB_HEADER_MAGIC = b"AVB0"
+_AVB_ROLLBACK_OFFSET = 112
+
+# avbtool info_image output keyed by (path, mtime_ns, size); a rewritten
+# image gets a new key, so entries never need explicit invalidation.
+_INFO_OUTPUT_CACHE: Dict[Tuple[str, int, int], str] = {}
+
 
 def _analyze_rollback_target(
     image_name: str,
@@ -22,7 +34,7 @@ def _analyze_rollback_target(
 
     if new_rb_index == current_rb_index:
         utils.ui.info(get_string("img_index_ok").format(name=image_name))
-        shutil.copy(new_image_path, patched_image_path)
+        utils.copy_file(new_image_path, patched_image_path)
         return None
 
     utils.ui.info(
@@ -44,11 +56,42 @@ def _require_info_keys(
             )
 
 
-def extract_image_avb_info(image_path: Path) -> Dict[str, Any]:
+def _read_avb_info_output(image_path: Path) -> str:
+    try:
+        st = os.stat(image_path)
+        key: Optional[Tuple[str, int, int]] = (
+            os.path.normcase(os.path.abspath(image_path)),
+            st.st_mtime_ns,
+            st.st_size,
+        )
+    except OSError:
+        key = None
+
+    if key is not None and key in _INFO_OUTPUT_CACHE:
+        return _INFO_OUTPUT_CACHE[key]
+
     avbtool = utils.AvbToolWrapper()
     info_proc = avbtool.run("info_image", "--image", image_path, capture=True)
-
     output = info_proc.stdout.strip()
+    if key is not None:
+        _INFO_OUTPUT_CACHE[key] = output
+    return output
+
+
+def prefetch_avb_info(image_paths: List[Path]) -> None:
+    """Runs avbtool info_image for several images at once.
+
+    Only the cached output is filled in; the later extract_image_avb_info
+    calls parse and log as usual without starting avbtool again.
+    """
+    if not image_paths:
+        return
+    with ThreadPoolExecutor(max_workers=len(image_paths)) as pool:
+        list(pool.map(_read_avb_info_output, image_paths))
+
+
+def extract_image_avb_info(image_path: Path) -> Dict[str, Any]:
+    output = _read_avb_info_output(image_path)
     info: Dict[str, Any] = {}
     props_args: List[str] = []
 
@@ -107,6 +150,32 @@ def extract_image_avb_info(image_path: Path) -> Dict[str, Any]:
     return info
 
 
+def read_rollback_index(image_path: Path) -> Optional[int]:
+    """Reads the vbmeta rollback index straight from the image.
+
+    Only the footer and header bytes are touched. Returns None when the
+    image has no recognisable AVB structures.
+    """
+    with image_path.open("rb") as f:
+        if f.seek(0, 2) < _AVB_FOOTER_SIZE:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            vbmeta_offset = 0
+            if mm[:4] != _AVB_HEADER_MAGIC:
+                magic, _, _, _, vbmeta_offset, _ = _AVB_FOOTER.unpack_from(
+                    mm, len(mm) - _AVB_FOOTER_SIZE
+                )
+                if magic != b"AVBf":
+                    return None
+
+            header = mm[vbmeta_offset : vbmeta_offset + _AVB_ROLLBACK_OFFSET + 8]
+            if len(header) < _AVB_ROLLBACK_OFFSET + 8:
+                return None
+            if header[:4] != _AVB_HEADER_MAGIC:
+                return None
+            return struct.unpack_from("!Q", header, _AVB_ROLLBACK_OFFSET)[0]
+
+
 def _apply_hash_footer(
     image_path: Path,
     image_info: Dict[str, Any],
@@ -184,7 +253,7 @@ def patch_chained_image_rollback(
                     )
                 )
 
-        shutil.copy(new_image_path, patched_image_path)
+        utils.copy_file(new_image_path, patched_image_path)
 
         _apply_hash_footer(
             image_path=patched_image_path,
@@ -357,9 +426,11 @@ def rebuild_vbmeta_with_chained_images(
     original_vbmeta_path: Path,
     chained_images: List[Path],
     padding_size: str = "8192",
+    vbmeta_info: Optional[Dict[str, Any]] = None,
 ) -> None:
     utils.ui.info(get_string("act_remake_vbmeta"))
-    vbmeta_info = extract_image_avb_info(original_vbmeta_path)
+    if vbmeta_info is None:
+        vbmeta_info = extract_image_avb_info(original_vbmeta_path)
 
     vbmeta_pubkey = vbmeta_info.get("pubkey_sha1")
     key_file = const.KEY_MAP.get(str(vbmeta_pubkey))
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .. import constants as const
 from .. import utils
@@ -64,29 +64,26 @@ def _patch_vendor_boot_logic(
         }
         target_patterns = [const.PRC_PATTERN_DOT, const.PRC_PATTERN_I]
 
-    modified_content = content
-    found_row_count = 0
+    patches: List[Tuple[int, bytes]] = []
 
     for target, replacement in patterns_map.items():
-        count = content.count(target)
-        if count > 0:
+        offsets = utils._find_all(content, target)
+        if offsets:
             utils.ui.info(
                 get_string("img_vb_found_replace").format(
-                    pattern=target.hex().upper(), count=count
+                    pattern=target.hex().upper(), count=len(offsets)
                 )
             )
-            modified_content = modified_content.replace(target, replacement)
-            found_row_count += count
+            patches.extend((offset, replacement) for offset in offsets)
 
-    if found_row_count > 0:
-        return modified_content, {
+    if patches:
+        return content, {
             "changed": True,
-            "message": get_string("img_code_replaced_total").format(
-                count=found_row_count
-            ),
+            "message": get_string("img_code_replaced_total").format(count=len(patches)),
+            "patches": patches,
         }
 
-    found_target = any(content.count(target) > 0 for target in target_patterns)
+    found_target = any(content.find(target) >= 0 for target in target_patterns)
     if found_target:
         return content, {
             "changed": False,
@@ -96,19 +93,34 @@ def _patch_vendor_boot_logic(
     return content, {"changed": False, "message": get_string("img_vb_no_patterns")}
 
 
-def edit_vendor_boot(
-    input_file_path: str, copy_if_unchanged: bool = True, target_region: str = "PRC"
-) -> bool:
+def _run_vendor_boot_patch(
+    input_file_path: str, copy_if_unchanged: bool, target_region: str
+) -> Tuple[bool, bool]:
     input_file = Path(input_file_path)
     output_file = input_file.parent / "vendor_boot_prc.img"
+    result: Dict[str, Any] = {}
+
+    def patch_logic(content: bytes, **kwargs: Any) -> Tuple[bytes, Dict[str, Any]]:
+        content, stats = _patch_vendor_boot_logic(content, **kwargs)
+        result.update(stats)
+        return content, stats
 
     success = utils._process_binary_file(
         input_file,
         output_file,
-        _patch_vendor_boot_logic,
+        patch_logic,
         copy_if_unchanged=copy_if_unchanged,
         target_region=target_region,
     )
+    return success, bool(result.get("changed", False))
+
+
+def edit_vendor_boot(
+    input_file_path: str, copy_if_unchanged: bool = True, target_region: str = "PRC"
+) -> bool:
+    success, _ = _run_vendor_boot_patch(
+        input_file_path, copy_if_unchanged, target_region
+    )
 
     if copy_if_unchanged and not success:
         raise RuntimeError(get_string("err_process_vendor_boot"))
@@ -116,6 +128,21 @@ def edit_vendor_boot(
     return success
 
 
+def convert_vendor_boot(input_file_path: str, target_region: str = "PRC") -> bool:
+    """Writes vendor_boot_prc.img next to the input and reports whether it changed.
+
+    An image that already carries the target patterns is copied through
+    unchanged and False is returned; a missing or unreadable input raises
+    RuntimeError just like edit_vendor_boot.
+    """
+    success, changed = _run_vendor_boot_patch(input_file_path, True, target_region)
+
+    if not success:
+        raise RuntimeError(get_string("err_process_vendor_boot"))
+
+    return changed
+
+
 def detect_country_codes() -> Dict[str, Optional[str]]:
     results: Dict[str, Optional[str]] = {}
     files_to_check = ["devinfo.img", "persist.img"]
@@ -177,7 +204,12 @@ def _patch_country_code_logic(
             ),
         }
 
-    count = sum(content.count(target) for target in targets_to_replace)
+    patches = [
+        (offset, replacement_bytes)
+        for target in targets_to_replace
+        for offset in utils._find_all(content, target)
+    ]
+    count = len(patches)
     if count > 0:
         utils.ui.info(
             get_string("img_code_replace").format(
@@ -186,13 +218,11 @@ def _patch_country_code_logic(
                 replacement=replacement_string,
             )
         )
-        modified_content = content
-        for target_bytes in targets_to_replace:
-            modified_content = modified_content.replace(target_bytes, replacement_bytes)
-        return modified_content, {
+        return content, {
             "changed": True,
             "message": get_string("img_code_replaced_total").format(count=count),
             "count": count,
+            "patches": patches,
         }
 
     return content, {
@@ -1,6 +1,7 @@
+import hashlib
+import mmap
+import os
 import re
-import shutil
-import sys
 from pathlib import Path
 from typing import Optional, Union
 
@@ -8,6 +9,10 @@ from .. import constants as const
 from .. import device, downloader, utils
 from ..i18n import get_string
 
+_LINUX_MARK = b"Linux version "
+_LINUX_VER_RE = re.compile(rb"Linux version (\d+\.\d+\.\d+)[ -~]*")
+_KVER_RE = re.compile(r"\d+\.\d+\.\d+")
+
 
 def _detect_preinit_device(
     dev: Optional[device.DeviceController],
@@ -33,6 +38,34 @@ def _detect_preinit_device(
     return match.group(1) if match else None
 
 
+def _sha1_file(path: Path) -> str:
+    sha1 = hashlib.sha1()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _repack_boot(
+    mb: utils.MagiskBootWrapper, img_name: str, work_dir: Path, out_path: Path
+) -> bool:
+    """Repacks img_name from work_dir straight into out_path.
+
+    magiskboot builds that ignore the output argument still leave
+    new-boot.img in work_dir, which is moved into place instead.
+    """
+    out_path.unlink(missing_ok=True)
+    mb.run("repack", img_name, str(out_path), cwd=work_dir)
+    if out_path.exists():
+        return True
+
+    new_boot = work_dir / "new-boot.img"
+    if not new_boot.exists():
+        return False
+    utils.move_file(new_boot, out_path)
+    return True
+
+
 def patch_boot_with_root_algo(
     work_dir: Path,
     magiskboot_exe: Path,
@@ -50,75 +83,72 @@ def patch_boot_with_root_algo(
     work_img_path = work_dir / img_name
 
     if not work_img_path.exists():
-        print(
-            get_string("img_root_err_img_not_found").format(name=img_name),
-            file=sys.stderr,
-        )
+        utils.ui.error(get_string("img_root_err_img_not_found").format(name=img_name))
         return None
 
     mb = utils.MagiskBootWrapper(magiskboot_exe)
 
     if gki:
-        print(get_string("img_root_step1").format(name=img_name))
+        utils.ui.info(get_string("img_root_step1").format(name=img_name))
         mb.run("unpack", img_name, cwd=work_dir)
         if not (work_dir / "kernel").exists():
-            print(get_string("img_root_unpack_fail"))
+            utils.ui.error(get_string("img_root_unpack_fail"))
             return None
-        print(get_string("img_root_unpack_ok"))
+        utils.ui.info(get_string("img_root_unpack_ok"))
 
-        print(get_string("img_root_step2"))
+        utils.ui.info(get_string("img_root_step2"))
         target_kernel_version = get_kernel_version(work_dir / "kernel")
 
         if not target_kernel_version:
-            print(get_string("img_root_kernel_ver_fail"))
+            utils.ui.error(get_string("img_root_kernel_ver_fail"))
             return None
 
-        if not re.match(r"\d+\.\d+\.\d+", target_kernel_version):
-            print(
+        if not _KVER_RE.fullmatch(target_kernel_version):
+            utils.ui.error(
                 get_string("img_root_kernel_invalid").format(ver=target_kernel_version)
             )
             return None
 
-        print(get_string("img_root_target_ver").format(ver=target_kernel_version))
+        utils.ui.info(
+            get_string("img_root_target_ver").format(ver=target_kernel_version)
+        )
 
         kernel_image_path = downloader.get_gki_kernel(target_kernel_version, work_dir)
 
-        print(get_string("img_root_step5"))
-        shutil.move(str(kernel_image_path), work_dir / "kernel")
-        print(get_string("img_root_kernel_replaced"))
+        utils.ui.info(get_string("img_root_step5"))
+        utils.move_file(kernel_image_path, work_dir / "kernel")
+        utils.ui.info(get_string("img_root_kernel_replaced"))
 
-        print(get_string("img_root_step6").format(name=img_name))
-        mb.run("repack", img_name, cwd=work_dir)
-        if not (work_dir / "new-boot.img").exists():
-            print(get_string("img_root_repack_fail"))
+        utils.ui.info(get_string("img_root_step6").format(name=img_name))
+        if not _repack_boot(mb, img_name, work_dir, patched_boot_path):
+            utils.ui.error(get_string("img_root_repack_fail"))
             return None
-        shutil.move(work_dir / "new-boot.img", patched_boot_path)
-        print(get_string("img_root_repack_ok"))
+        utils.ui.info(get_string("img_root_repack_ok"))
 
         return patched_boot_path
 
     else:
-        print(get_string("img_root_step1_init_boot").format(name=img_name))
+        utils.ui.info(get_string("img_root_step1_init_boot").format(name=img_name))
         mb.run("unpack", img_name, cwd=work_dir)
         if not (work_dir / "ramdisk.cpio").exists():
-            print(get_string("img_root_unpack_fail"))
+            utils.ui.error(get_string("img_root_unpack_fail"))
             return None
-        print(get_string("img_root_unpack_ok"))
+        utils.ui.info(get_string("img_root_unpack_ok"))
 
         if not skip_lkm_download:
             try:
                 if root_type == "magisk":
-                    print(get_string("img_root_magisk_download"))
+                    utils.ui.info(get_string("img_root_magisk_download"))
                     apk_path = downloader.download_magisk_apk(work_dir)
                     downloader.extract_magisk_libs(apk_path, work_dir)
                 else:
-                    print(get_string("img_root_lkm_download"))
+                    utils.ui.info(get_string("img_root_lkm_download"))
                     ksuinit_path = work_dir / "init"
                     kmod_path = work_dir / "kernelsu.ko"
 
                     if root_type == "sukisu":
                         if not lkm_kernel_version:
-                            print(get_string("img_root_lkm_no_dev"), file=sys.stderr)
+                            utils.ui.error(get_string("img_root_lkm_no_dev"))
                             return None
 
                         downloader.download_nightly_artifacts(
@@ -131,7 +161,7 @@ def patch_boot_with_root_algo(
                     else:
                         downloader.download_ksuinit_release(ksuinit_path)
                         if not lkm_kernel_version:
-                            print(get_string("img_root_lkm_no_dev"), file=sys.stderr)
+                            utils.ui.error(get_string("img_root_lkm_no_dev"))
                             return None
                         downloader.get_lkm_kernel_release(kmod_path, lkm_kernel_version)
 
@@ -141,15 +171,15 @@ def patch_boot_with_root_algo(
                     if root_type == "magisk"
                     else "img_root_lkm_download_fail"
                 )
-                print(get_string(error_key).format(e=e), file=sys.stderr)
+                utils.ui.error(get_string(error_key).format(e=e))
                 return None
         else:
-            print(get_string("img_root_skip_download"))
+            utils.ui.info(get_string("img_root_skip_download"))
 
         if root_type == "magisk":
-            print(get_string("img_root_magisk_patch"))
+            utils.ui.info(get_string("img_root_magisk_patch"))
         else:
-            print(get_string("img_root_lkm_patch"))
+            utils.ui.info(get_string("img_root_lkm_patch"))
 
         init_exists_proc = mb.run(
             "cpio",
@@ -161,7 +191,7 @@ def patch_boot_with_root_algo(
         )
 
         if init_exists_proc.returncode == 0 and root_type != "magisk":
-            print(get_string("img_root_lkm_backup_init"))
+            utils.ui.info(get_string("img_root_lkm_backup_init"))
             mb.run("cpio", "ramdisk.cpio", "mv init init.real", cwd=work_dir)
 
         if root_type == "magisk":
@@ -175,15 +205,14 @@ def patch_boot_with_root_algo(
                 name for name in required_files if not (work_dir / name).exists()
             ]
             if missing_files:
-                print(
+                utils.ui.error(
                     get_string("img_root_magisk_missing").format(
                         files=", ".join(missing_files)
-                    ),
-                    file=sys.stderr,
+                    )
                 )
                 return None
 
-            print(get_string("img_root_magisk_add_files"))
+            utils.ui.info(get_string("img_root_magisk_add_files"))
             config_path = work_dir / "config"
             config_entries = [
                 "KEEPVERITY=false",
@@ -194,20 +223,18 @@ def patch_boot_with_root_algo(
             preinit_device = _detect_preinit_device(dev)
             if preinit_device:
                 config_entries.append(f"PREINITDEVICE={preinit_device}")
-            sha1_proc = mb.run(
-                "sha1", img_name, cwd=work_dir, check=False, capture=True
-            )
-            if sha1_proc.returncode == 0:
-                sha1 = sha1_proc.stdout.strip()
-                if sha1:
-                    config_entries.append(f"SHA1={sha1}")
-            config_path.write_text(
-                "\n".join(config_entries) + "\n",
-                encoding="utf-8",
+            config_entries.append(f"SHA1={_sha1_file(work_img_path)}")
+            config_path.write_bytes(
+                b"".join(entry.encode("ascii") + b"\n" for entry in config_entries)
             )
             ramdisk_backup = work_dir / "ramdisk.cpio.orig"
             if not ramdisk_backup.exists():
-                shutil.copy(work_dir / "ramdisk.cpio", ramdisk_backup)
+                # magiskboot consumes the backup before writing ramdisk.cpio
+                # back, so a hardlink is enough and avoids a full copy.
+                try:
+                    os.link(work_dir / "ramdisk.cpio", ramdisk_backup)
+                except OSError:
+                    utils.copy_file(work_dir / "ramdisk.cpio", ramdisk_backup)
 
             mb.run("compress=xz", "magisk", "magisk.xz", cwd=work_dir)
             mb.run("compress=xz", "stub.apk", "stub.xz", cwd=work_dir)
@@ -228,30 +255,26 @@ def patch_boot_with_root_algo(
                 "add 000 .backup/.magisk config",
                 cwd=work_dir,
             )
-            for temp_name in [
+            for temp_name in (
                 "ramdisk.cpio.orig",
                 "config",
                 "magisk.xz",
                 "stub.xz",
                 "init-ld.xz",
-            ]:
-                temp_path = work_dir / temp_name
-                if temp_path.exists():
-                    temp_path.unlink()
+            ):
+                (work_dir / temp_name).unlink(missing_ok=True)
         else:
-            print(get_string("img_root_lkm_add_files"))
+            utils.ui.info(get_string("img_root_lkm_add_files"))
             mb.run("cpio", "ramdisk.cpio", "add 0755 init init", cwd=work_dir)
             mb.run(
                 "cpio", "ramdisk.cpio", "add 0755 kernelsu.ko kernelsu.ko", cwd=work_dir
             )
 
-        print(get_string("img_root_step6_init_boot").format(name=img_name))
-        mb.run("repack", img_name, cwd=work_dir)
-        if not (work_dir / "new-boot.img").exists():
-            print(get_string("img_root_repack_fail"))
+        utils.ui.info(get_string("img_root_step6_init_boot").format(name=img_name))
+        if not _repack_boot(mb, img_name, work_dir, patched_boot_path):
+            utils.ui.error(get_string("img_root_repack_fail"))
             return None
-        shutil.move(work_dir / "new-boot.img", patched_boot_path)
-        print(get_string("img_root_repack_ok"))
+        utils.ui.info(get_string("img_root_repack_ok"))
 
         return patched_boot_path
 
@@ -259,37 +282,34 @@ def patch_boot_with_root_algo(
 def get_kernel_version(file_path: Union[str, Path]) -> Optional[str]:
     kernel_file = Path(file_path)
     if not kernel_file.exists():
-        print(
-            get_string("img_kv_err_not_found").format(path=file_path), file=sys.stderr
-        )
+        utils.ui.error(get_string("img_kv_err_not_found").format(path=file_path))
         return None
 
     try:
-        content = kernel_file.read_bytes()
-        potential_strings = re.findall(b"[ -~]{10,}", content)
-
         found_version = None
-        for string_bytes in potential_strings:
-            try:
-                line = string_bytes.decode("ascii", errors="ignore")
-                if "Linux version " in line:
-                    base_version_match = re.search(r"(\d+\.\d+\.\d+)", line)
-                    if base_version_match:
-                        found_version = base_version_match.group(1)
-                        print(
-                            get_string("img_kv_found").format(line=line.strip()),
-                            file=sys.stderr,
-                        )
+        if kernel_file.stat().st_size > 0:
+            with (
+                kernel_file.open("rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content,
+            ):
+                match = None
+                pos = content.find(_LINUX_MARK)
+                while pos >= 0:
+                    match = _LINUX_VER_RE.match(content, pos)
+                    if match:
                         break
-            except UnicodeDecodeError:
-                continue
+                    pos = content.find(_LINUX_MARK, pos + 1)
+                if match:
+                    found_version = match.group(1).decode("ascii")
+                    line = match.group(0).decode("ascii", errors="ignore")
+                    utils.ui.info(get_string("img_kv_found").format(line=line.strip()))
 
         if found_version:
             return found_version
         else:
-            print(get_string("img_kv_err_parse"), file=sys.stderr)
+            utils.ui.error(get_string("img_kv_err_parse"))
             return None
 
     except Exception as e:
-        print(get_string("unexpected_error").format(e=e), file=sys.stderr)
+        utils.ui.error(get_string("unexpected_error").format(e=e))
         return None
@@ -1,17 +1,61 @@
 import os
 import shutil
-from typing import List
+import sys
+import threading
+from typing import List, Optional
 
 from .logger import get_logger
 
 logger = get_logger()
 
+_CLEAR_SCREEN = "\033[2J\033[3J\033[H"
+
+
+def _enable_vt_mode() -> bool:
+    if sys.platform != "win32":
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
 
 class ConsoleUI:
+    _vt_enabled: Optional[bool] = None
+    _MAX_PENDING = 32
+
+    def __init__(self) -> None:
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+
     def get_term_width(self, max_width: int = 78) -> int:
         return min(max_width, shutil.get_terminal_size((80, 24)).columns)
 
+    def buffer(self, message: str) -> None:
+        """Queues an info line; it is written by the next flush or echo."""
+        with self._lock:
+            self._pending.append(message)
+            full = len(self._pending) >= self._MAX_PENDING
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes pending lines; call it before print() or input() bypass ui."""
+        with self._lock:
+            if self._pending:
+                message = "\n".join(self._pending)
+                self._pending.clear()
+                logger.info(message)
+
     def echo(self, message: str = "", err: bool = False) -> None:
+        self.flush()
         if err:
             logger.error(message)
         else:
@@ -26,17 +70,34 @@ class ConsoleUI:
     def error(self, message: str) -> None:
         self.echo(f"\033[91m{message}\033[0m", err=True)
 
+    def banner(self, lines: List[str], char: str = "=", error: bool = False) -> None:
+        """Writes lines between two full-width rules as a single record.
+
+        With error=True the record is written in red, like error().
+        """
+        rule = char * self.get_term_width()
+        message = f"\n{rule}\n" + "\n".join(lines) + f"\n{rule}\n"
+        if error:
+            self.error(message)
+        else:
+            self.echo(message)
+
     def box_output(self, lines: List[str], err: bool = False) -> None:
-        self.echo("", err=err)
-        for line in lines:
-            self.echo(line, err=err)
-        self.echo("", err=err)
+        self.echo("\n" + "\n".join(lines) + "\n", err=err)
 
     def prompt(self, message: str = "") -> str:
+        self.flush()
         return input(message)
 
     def clear(self) -> None:
-        os.system("cls")
+        self.flush()
+        if self._vt_enabled is None:
+            self._vt_enabled = _enable_vt_mode()
+        if self._vt_enabled:
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            os.system("cls")
 
 
 ui = ConsoleUI()
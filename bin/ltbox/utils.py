@@ -1,13 +1,30 @@
+import codecs
+import fnmatch
+import io
 import json
+import mmap
 import os
+import re
 import shutil
 import subprocess
+import sys
 import time
 import urllib.request
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Generator, Iterable, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from . import constants as const
 from .i18n import get_string
@@ -87,11 +104,14 @@ def wait_for_condition(
         time.sleep(interval)
 
 
+_READ_CHUNK_SIZE = 65536
+
+
 def _run_command(
     command: Union[List[str], str],
     shell: bool,
     check: bool,
-    env: dict,
+    env: Optional[dict],
     cwd: Optional[Union[str, Path]],
     capture: bool,
     on_output: Optional[Callable[[str], None]],
@@ -107,36 +127,55 @@ def _run_command(
             **run_kwargs,
         )
 
+    ui.flush()
     process = subprocess.Popen(
         command,
         shell=shell,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        **run_kwargs,
+        bufsize=0,
+        env=run_kwargs["env"],
+        cwd=run_kwargs["cwd"],
     )
 
-    output_lines = []
+    def _emit(line: str) -> None:
+        if on_output is not None:
+            on_output(line)
+        else:
+            logger.info(line.rstrip())
+
+    # Read whatever the pipe has (up to 64 KiB) instead of one line per
+    # call; decoding and newline handling match text mode.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(run_kwargs["encoding"])(run_kwargs["errors"]),
+        translate=True,
+    )
+    output = io.StringIO()
+    pending = ""
     if process.stdout:
-        for line in process.stdout:
-            if on_output is not None:
-                on_output(line)
-            else:
-                logger.info(line.rstrip())
-            output_lines.append(line)
+        fd = process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            text = decoder.decode(chunk, final=not chunk)
+            if text:
+                output.write(text)
+                *lines, pending = (pending + text).split("\n")
+                for line in lines:
+                    _emit(line + "\n")
+            if not chunk:
+                break
+        if pending:
+            _emit(pending)
+        process.stdout.close()
 
     process.wait()
     returncode = process.returncode
+    stdout = output.getvalue()
 
     if check and returncode != 0:
-        raise subprocess.CalledProcessError(
-            returncode, command, output="".join(output_lines)
-        )
+        raise subprocess.CalledProcessError(returncode, command, output=stdout)
 
-    return subprocess.CompletedProcess(
-        command, returncode, stdout="".join(output_lines), stderr=None
-    )
+    return subprocess.CompletedProcess(command, returncode, stdout=stdout, stderr=None)
 
 
 def run_command(
@@ -155,7 +194,9 @@ def run_command(
     )
 
 
-def _get_subprocess_kwargs(env: dict, cwd: Optional[Union[str, Path]]) -> dict:
+def _get_subprocess_kwargs(
+    env: Optional[dict], cwd: Optional[Union[str, Path]]
+) -> dict:
     return {
         "encoding": "utf-8",
         "errors": "ignore",
@@ -176,6 +217,29 @@ def get_platform_executable(name: str) -> Path:
     return const.DOWNLOAD_DIR / f"{name}.exe"
 
 
+@functools.cache
+def _compile_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+    )
+
+
+def _iter_matching(dir_path: Path, patterns: Iterable[str]) -> Iterator[Path]:
+    """Yields files in dir_path matching any of the glob patterns.
+
+    The directory is read once regardless of how many patterns are given.
+    Matching follows the platform's case rules, like Path.glob.
+    """
+    match = _compile_patterns(tuple(patterns)).match
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if match(os.path.normcase(entry.name)) and entry.is_file():
+                    yield Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
 def _wait_for_resource(
     target_path: Path,
     check_func: Callable[[Path, Optional[List[str]]], bool],
@@ -201,10 +265,12 @@ def _wait_for_resource(
         except EOFError:
             raise RuntimeError(get_string("act_op_cancel"))
 
+    # The Enter prompt already blocks between checks, so there is no
+    # polling to throttle; re-check as soon as the user confirms.
     return bool(
         wait_for_condition(
             lambda: check_func(target_path, item_list),
-            interval=0.1,
+            interval=0,
             on_loop=_prompt_loop,
         )
     )
@@ -213,20 +279,37 @@ def _wait_for_resource(
 def wait_for_files(
     directory: Path, required_files: List[str], prompt_message: str
 ) -> bool:
+    required_set = {os.path.normcase(name) for name in required_files}
     return _wait_for_resource(
         directory,
-        lambda p, f: all((p / i).exists() for i in (f or [])),
+        lambda p, _: required_set.issubset(_list_dir_names(p)),
         prompt_message,
         required_files,
     )
 
 
+def is_dir_nonempty(path: Path) -> bool:
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 def wait_for_directory(directory: Path, prompt_message: str) -> bool:
     return _wait_for_resource(
-        directory, lambda p, _: p.is_dir() and any(p.iterdir()), prompt_message, None
+        directory, lambda p, _: is_dir_nonempty(p), prompt_message, None
     )
 
 
+def _list_dir_names(directory: Path) -> set:
+    try:
+        with os.scandir(directory) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def check_dependencies() -> None:
     is_git_checkout = (const.BASE_DIR / ".git").exists()
     missing_edl_binaries = (
@@ -255,8 +338,16 @@ def check_dependencies() -> None:
     for path in const.KEY_MAP.values():
         dependencies[path.name] = path
 
+    names_by_parent: dict = {}
+    for path in dependencies.values():
+        parent = Path(path).parent
+        if parent not in names_by_parent:
+            names_by_parent[parent] = _list_dir_names(parent)
+
     missing_deps = [
-        name for name, path in dependencies.items() if not Path(path).exists()
+        name
+        for name, path in dependencies.items()
+        if os.path.normcase(Path(path).name) not in names_by_parent[Path(path).parent]
     ]
 
     if missing_deps:
@@ -268,34 +359,126 @@ def check_dependencies() -> None:
     ui.echo(get_string("utils_deps_found"))
 
 
+def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Renames src over dst, falling back to shutil.move across devices."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copies file contents only, letting the OS do the transfer.
+
+    Uses CopyFile2 on Windows; elsewhere shutil.copyfile already takes the
+    sendfile/copy_file_range path.
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            copy_file2 = ctypes.windll.kernel32.CopyFile2
+            copy_file2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+            copy_file2.restype = ctypes.c_long
+            if copy_file2(str(src), str(dst), None) == 0:
+                return
+        except (AttributeError, OSError):
+            pass
+    shutil.copyfile(src, dst)
+
+
+def tree_copy_jobs(src: Path, dst: Path) -> List[Tuple[Path, Path]]:
+    """Creates src's directory layout under dst and lists its file copies."""
+    jobs: List[Tuple[Path, Path]] = []
+    for root, _, names in os.walk(src):
+        target = dst / os.path.relpath(root, src)
+        target.mkdir(parents=True, exist_ok=True)
+        jobs.extend((Path(root, name), target / name) for name in names)
+    return jobs
+
+
+def _safe_copy(job: Tuple[Path, Path]) -> Optional[OSError]:
+    try:
+        copy_file(*job)
+    except OSError as e:
+        return e
+    return None
+
+
+def copy_files(
+    jobs: List[Tuple[Path, Path]], max_workers: int = 8
+) -> List[Optional[OSError]]:
+    """Runs (src, dst) copies on a small thread pool.
+
+    Returns one error (or None) per job, in input order.
+    """
+    if len(jobs) <= 1:
+        return [_safe_copy(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(_safe_copy, jobs))
+
+
 def move_existing_files(files: Iterable[Path], dst_dir: Path) -> int:
     dst_dir.mkdir(exist_ok=True, parents=True)
     moved_count = 0
     for f in files:
         if f.exists():
-            shutil.move(str(f), str(dst_dir / f.name))
+            move_file(f, dst_dir / f.name)
             moved_count += 1
     return moved_count
 
 
+def _safe_unlink(path: Path) -> Tuple[Path, Optional[OSError]]:
+    try:
+        path.unlink()
+    except OSError as e:
+        return path, e
+    return path, None
+
+
+def unlink_files(
+    paths: Iterable[Path], max_workers: int = 8
+) -> List[Tuple[Path, Optional[OSError]]]:
+    """Deletes files on a small thread pool and returns (path, error) pairs.
+
+    Results keep the input order so callers can log them from the main
+    thread.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [_safe_unlink(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_safe_unlink, paths))
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Removes a directory tree, skipping the tree walk when it is empty."""
+    with os.scandir(path) as it:
+        is_empty = next(it, None) is None
+    if is_empty:
+        os.rmdir(path)
+    else:
+        shutil.rmtree(path)
+
+
 def recreate_dir(path: Path) -> None:
     """Removes the directory if it exists, then creates a fresh one."""
     if path.exists():
-        shutil.rmtree(path)
+        _fast_rmtree(path)
     path.mkdir(parents=True, exist_ok=True)
 
 
 @contextmanager
 def temporary_workspace(path: Path) -> Generator[Path, None, None]:
     if path.exists():
-        shutil.rmtree(path)
+        _fast_rmtree(path)
     path.mkdir(parents=True)
     try:
         yield path
     finally:
         if path.exists():
             try:
-                shutil.rmtree(path)
+                _fast_rmtree(path)
             except OSError as e:
                 ui.echo(
                     get_string("warn_failed_cleanup_workspace").format(path=path, e=e),
@@ -303,6 +486,27 @@ def temporary_workspace(path: Path) -> Generator[Path, None, None]:
                 )
 
 
+def _find_all(content: Any, pattern: bytes) -> List[int]:
+    """Returns the non-overlapping offsets of pattern, like bytes.replace."""
+    offsets = []
+    pos = content.find(pattern)
+    while pos >= 0:
+        offsets.append(pos)
+        pos = content.find(pattern, pos + len(pattern))
+    return offsets
+
+
+def _apply_patches(
+    input_path: Path, output_path: Path, patches: List[Tuple[int, bytes]]
+) -> None:
+    if input_path != output_path:
+        copy_file(input_path, output_path)
+    with output_path.open("r+b") as f:
+        for offset, data in patches:
+            f.seek(offset)
+            f.write(data)
+
+
 def _process_binary_file(
     input_path: Union[str, Path],
     output_path: Union[str, Path],
@@ -310,6 +514,13 @@ def _process_binary_file(
     copy_if_unchanged: bool = True,
     **kwargs: Any,
 ) -> bool:
+    """Runs patch_func over a read-only mapping of input_path.
+
+    patch_func returns (content, stats). When stats carries "patches", a
+    list of (offset, bytes) overwrites, only those ranges are written on
+    top of a copy of the input; otherwise the returned content is written
+    out as a whole.
+    """
     input_path = Path(input_path)
     output_path = Path(output_path)
 
@@ -318,11 +529,22 @@ def _process_binary_file(
         return False
 
     try:
-        content = input_path.read_bytes()
-        modified_content, stats = patch_func(content, **kwargs)
+        with input_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    modified_content, stats = patch_func(content, **kwargs)
+                    patches = stats.get("patches")
+                    if stats.get("changed", False) and patches is None:
+                        modified_content = bytes(modified_content)
+            else:
+                modified_content, stats = patch_func(b"", **kwargs)
+                patches = stats.get("patches")
 
         if stats.get("changed", False):
-            output_path.write_bytes(modified_content)
+            if patches is not None:
+                _apply_patches(input_path, output_path, patches)
+            else:
+                output_path.write_bytes(modified_content)
             ui.echo(
                 get_string("img_proc_success").format(
                     msg=stats.get("message", get_string("img_proc_msg_modified"))
@@ -340,7 +562,7 @@ def _process_binary_file(
             if copy_if_unchanged:
                 ui.echo(get_string("img_proc_copying").format(name=output_path.name))
                 if input_path != output_path:
-                    shutil.copy(input_path, output_path)
+                    copy_file(input_path, output_path)
                 return True
             return False
 
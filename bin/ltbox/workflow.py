@@ -1,8 +1,12 @@
+import os
 import shutil
+import stat
 import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Callable, Optional
+from functools import partial
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
 
 from . import actions
 from . import constants as const
@@ -22,10 +26,21 @@ def _cleanup_previous_outputs(ctx: TaskContext) -> None:
         const.OUTPUT_XML_DIR,
     ]
 
-    for folder in output_folders_to_clean:
-        if folder.exists():
+    # Missing and already-empty folders need no work; every later step
+    # recreates or clears its own output folder before writing to it.
+    populated_folders = [f for f in output_folders_to_clean if utils.is_dir_nonempty(f)]
+    if not populated_folders:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(populated_folders)) as executor:
+        futures = {
+            executor.submit(shutil.rmtree, folder): folder
+            for folder in populated_folders
+        }
+        for future in as_completed(futures):
+            folder = futures[future]
             try:
-                shutil.rmtree(folder)
+                future.result()
             except OSError as e:
                 raise LTBoxError(
                     get_string("utils_remove_error").format(name=folder.name, e=e), e
@@ -33,11 +48,12 @@ def _cleanup_previous_outputs(ctx: TaskContext) -> None:
 
 
 def _populate_device_info(ctx: TaskContext) -> None:
+    ctx.dev.prefetch_device_info()
     ctx.active_slot_suffix = ctx.dev.detect_active_slot()
 
     if not ctx.dev.skip_adb:
         try:
-            ctx.device_model = ctx.dev.adb.get_model()
+            ctx.device_model = ctx.dev.get_model()
             if not ctx.device_model:
                 raise DeviceError(get_string("wf_err_adb_model"))
         except Exception as e:
@@ -92,6 +108,13 @@ def _patch_devinfo(ctx: TaskContext) -> None:
         )
 
 
+def _is_regular_file(path: Path) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path, follow_symlinks=False).st_mode)
+    except OSError:
+        return False
+
+
 def _check_and_patch_arb(ctx: TaskContext) -> None:
     if not ctx.boot_target or not ctx.vbmeta_target:
         raise LTBoxError(get_string("wf_err_halted"))
@@ -99,6 +122,9 @@ def _check_and_patch_arb(ctx: TaskContext) -> None:
     dumped_boot = const.BACKUP_DIR / f"{ctx.boot_target}.img"
     dumped_vbmeta = const.BACKUP_DIR / f"{ctx.vbmeta_target}.img"
 
+    if not (_is_regular_file(dumped_boot) and _is_regular_file(dumped_vbmeta)):
+        raise LTBoxError(get_string("act_err_dumped_missing"))
+
     arb_status_result = actions.read_anti_rollback(
         dumped_boot_path=dumped_boot, dumped_vbmeta_path=dumped_vbmeta
     )
@@ -119,22 +145,27 @@ def _log_workflow_halt() -> None:
     utils.ui.echo(get_string("wf_err_halted"), err=True)
 
 
-@dataclass(frozen=True)
-class WorkflowStep:
-    label_key: Optional[str]
+class WorkflowStep(NamedTuple):
+    label: Optional[str]
     action: Callable[[], None]
-    after_label_key: Optional[str] = None
+    after_label: Optional[str] = None
 
 
 def _run_step(ctx: TaskContext, step: WorkflowStep) -> None:
-    if step.label_key:
-        ctx.on_log(get_string(step.label_key))
-    step.action()
-    if step.after_label_key:
-        ctx.on_log(get_string(step.after_label_key))
+    label, action, after_label = step
+    try:
+        if label:
+            ctx.on_log(label)
+            # Steps may print or prompt directly, so the label goes out first.
+            utils.ui.flush()
+        action()
+        if after_label:
+            ctx.on_log(after_label)
+    finally:
+        utils.ui.flush()
 
 
-def _run_steps(ctx: TaskContext, steps: list[WorkflowStep]) -> None:
+def _run_steps(ctx: TaskContext, steps: tuple[WorkflowStep, ...]) -> None:
     for step in steps:
         _run_step(ctx, step)
 
@@ -161,23 +192,31 @@ def _run_arb_step(ctx: TaskContext) -> None:
     _check_and_patch_arb(ctx)
 
 
-def _build_steps(ctx: TaskContext) -> list[WorkflowStep]:
-    return [
-        WorkflowStep("wf_step1_clean", lambda: _cleanup_previous_outputs(ctx)),
-        WorkflowStep("wf_step2_device_info", lambda: _populate_device_info(ctx)),
-        WorkflowStep(None, lambda: _log_active_slot(ctx)),
+def _build_steps(ctx: TaskContext) -> tuple[WorkflowStep, ...]:
+    return (
         WorkflowStep(
-            "wf_step3_wait_image",
-            lambda: _wait_for_input_images(ctx),
-            after_label_key="wf_step3_found",
+            get_string("wf_step1_clean"), partial(_cleanup_previous_outputs, ctx)
         ),
-        WorkflowStep("wf_step4_convert", lambda: _convert_region_images(ctx)),
-        WorkflowStep("wf_step5_modify_xml", lambda: _decrypt_and_modify_xml(ctx)),
-        WorkflowStep("wf_step6_dump", lambda: _run_dump_step(ctx)),
-        WorkflowStep(None, lambda: _run_patch_dp_step(ctx)),
-        WorkflowStep(None, lambda: _run_arb_step(ctx)),
-        WorkflowStep("wf_step9_flash", lambda: _flash_images(ctx)),
-    ]
+        WorkflowStep(
+            get_string("wf_step2_device_info"), partial(_populate_device_info, ctx)
+        ),
+        WorkflowStep(None, partial(_log_active_slot, ctx)),
+        WorkflowStep(
+            get_string("wf_step3_wait_image"),
+            partial(_wait_for_input_images, ctx),
+            after_label=get_string("wf_step3_found"),
+        ),
+        WorkflowStep(
+            get_string("wf_step4_convert"), partial(_convert_region_images, ctx)
+        ),
+        WorkflowStep(
+            get_string("wf_step5_modify_xml"), partial(_decrypt_and_modify_xml, ctx)
+        ),
+        WorkflowStep(get_string("wf_step6_dump"), partial(_run_dump_step, ctx)),
+        WorkflowStep(None, partial(_run_patch_dp_step, ctx)),
+        WorkflowStep(None, partial(_run_arb_step, ctx)),
+        WorkflowStep(get_string("wf_step9_flash"), partial(_flash_images, ctx)),
+    )
 
 
 def _log_active_slot(ctx: TaskContext) -> None:
@@ -200,7 +239,7 @@ def patch_all(
         wipe=wipe,
         skip_rollback=skip_rollback,
         target_region=target_region,
-        on_log=lambda s: utils.ui.info(s),
+        on_log=utils.ui.buffer,
     )
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -223,14 +262,17 @@ def patch_all(
                 ctx.on_log(get_string("wf_nowipe_mode_start"))
             _run_steps(ctx, _build_steps(ctx))
 
-            success_msg = get_string("wf_process_complete")
-            success_msg += f"\n{get_string('wf_process_complete_info')}"
-
+            parts = [
+                get_string("wf_process_complete"),
+                get_string("wf_process_complete_info"),
+            ]
             if ctx.backup_dir_name:
-                success_msg += f"\n\n{get_string('wf_backup_notice').format(dir=ctx.backup_dir_name)}"
-
-            success_msg += f"\n\n{get_string('wf_notice_widevine')}"
-            return success_msg
+                parts += [
+                    "",
+                    get_string("wf_backup_notice").format(dir=ctx.backup_dir_name),
+                ]
+            parts += ["", get_string("wf_notice_widevine")]
+            return "\n".join(parts)
 
     except BaseException as e:
         _log_workflow_halt()
@@ -59,7 +59,7 @@ def test_flash_args(mock_env):
     with (
         patch("ltbox.actions.edl.utils.ui") as mock_ui,
         patch("ltbox.actions.edl.ensure_loader_file"),
-        patch("ltbox.actions.edl._prepare_flash_files"),
+        patch("ltbox.actions.edl._plan_flash_copy", return_value=([], [], {})),
         patch("builtins.input", return_value="y"),
     ):
         mock_ui.prompt.return_value = "y"
@@ -73,6 +73,74 @@ def test_flash_args(mock_env):
         assert len(passed) == 2
 
 
+def test_flash_copies_while_waiting_for_edl(mock_env):
+    import threading
+
+    create_xmls(mock_env["IMAGE_DIR"], ["rawprogram1.xml", "patch0.xml"])
+    (mock_env["OUTPUT_DIR"] / "boot.img").write_bytes(b"boot")
+    session_entered = threading.Event()
+    copy_file = utils.copy_file
+    output_threads = set()
+
+    def slow_copy(src, dst):
+        assert session_entered.wait(5)
+        copy_file(src, dst)
+
+    def record_thread(*args, **kwargs):
+        output_threads.add(threading.current_thread())
+
+    mock_dev = MagicMock()
+    mock_dev.edl_session.return_value.__enter__.side_effect = lambda *_: (
+        session_entered.set() or "COM5"
+    )
+
+    with (
+        patch("ltbox.actions.edl.utils.ui") as mock_ui,
+        patch("ltbox.actions.edl.ensure_loader_file"),
+        patch("ltbox.actions.edl.utils.copy_file", side_effect=slow_copy),
+    ):
+        mock_ui.echo.side_effect = record_thread
+        mock_ui.error.side_effect = record_thread
+        edl.flash_full_firmware(mock_dev, skip_reset=True, skip_reset_edl=True)
+
+    mock_dev.edl.flash_rawprogram.assert_called_once()
+    assert (mock_env["IMAGE_DIR"] / "boot.img").read_bytes() == b"boot"
+    assert output_threads == {threading.main_thread()}
+
+
+def test_flash_joins_copy_when_edl_setup_fails(mock_env):
+    import threading
+    import time
+
+    create_xmls(mock_env["IMAGE_DIR"], ["rawprogram1.xml", "patch0.xml"])
+    (mock_env["OUTPUT_DIR"] / "boot.img").write_bytes(b"boot")
+    copy_file = utils.copy_file
+    copy_started = threading.Event()
+
+    def slow_copy(src, dst):
+        copy_started.set()
+        time.sleep(0.2)
+        copy_file(src, dst)
+
+    def fail_setup(*_):
+        assert copy_started.wait(5)
+        raise RuntimeError("no port")
+
+    mock_dev = MagicMock()
+    mock_dev.edl_session.return_value.__enter__.side_effect = fail_setup
+
+    with (
+        patch("ltbox.actions.edl.utils.ui"),
+        patch("ltbox.actions.edl.ensure_loader_file"),
+        patch("ltbox.actions.edl.utils.copy_file", side_effect=slow_copy),
+    ):
+        with pytest.raises(RuntimeError):
+            edl.flash_full_firmware(mock_dev, skip_reset=True, skip_reset_edl=True)
+
+    assert (mock_env["IMAGE_DIR"] / "boot.img").read_bytes() == b"boot"
+    mock_dev.edl.flash_rawprogram.assert_not_called()
+
+
 def test_xml_fallback(mock_env):
     out_dir = mock_env["OUTPUT_XML_DIR"]
     target = out_dir / "rawprogram_save_persist_unsparse0.xml"
@@ -123,6 +191,42 @@ def test_xml_wipe(fw_pkg):
         assert p.get("filename") == ""
 
 
+def test_xml_wipe_leaves_file_untouched_without_changes(tmp_path):
+    tmp_xml = tmp_path / "rawprogram_save_persist_unsparse0.xml"
+    original = (
+        b'<?xml version="1.0" ?>\n<data>\n'
+        b'  <program label="userdata" filename="" />\n</data>\n'
+    )
+    tmp_xml.write_bytes(original)
+
+    with (
+        patch("ltbox.actions.xml.utils.ui"),
+        patch.object(xml_action.RawProgramXml, "save") as mock_save,
+    ):
+        xml_action._patch_xml_for_wipe(tmp_xml, wipe=1)
+        xml_action._patch_xml_for_wipe(tmp_xml, wipe=0)
+
+    mock_save.assert_not_called()
+    assert tmp_xml.read_bytes() == original
+
+
+def test_cleanup_garbage_xmls_deletes_only_garbage(tmp_path):
+    names = [
+        "rawprogram_unsparse0.xml",
+        "rawprogram0_WIPE_PARTITIONS.xml",
+        "rawprogram0_BLANK_GPT.xml",
+        "rawprogram_save_persist_unsparse0.xml",
+        "patch0.xml",
+    ]
+    for name in names:
+        (tmp_path / name).write_text("<data />", encoding="utf-8")
+
+    with patch("ltbox.actions.xml.utils.ui"):
+        xml_action._cleanup_garbage_xmls(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names[3:])
+
+
 def test_xml_persist_check(fw_pkg):
     path = fw_pkg.get("rawprogram_save_persist_unsparse0.xml")
     if not path:
@@ -442,3 +546,248 @@ def test_root_magisk(fw_pkg, tmp_path):
         assert (mock_dirs["OUTPUT_ROOT_MAGISK_DIR"] / "vbmeta.img").exists()
 
         print(f"[PASS] Magisk Integration Test Complete. Output: {final_output}")
+
+
+def test_dump_skips_unresolved_targets(mock_env):
+    dev = MagicMock()
+    dev.edl_session.return_value.__enter__.return_value = "COM3"
+    params = {
+        "source_xml": "rawprogram0.xml",
+        "lun": "0",
+        "start_sector": "8",
+        "num_sectors": "2",
+    }
+
+    def fake_params(target):
+        if target == "missing":
+            raise ValueError("not found")
+        if target == "broken":
+            raise RuntimeError("no avbtool")
+        return params
+
+    with (
+        patch.object(const, "BACKUP_DIR", mock_env["OUTPUT_DIR"]),
+        patch("ltbox.actions.edl.ensure_params_or_fail", side_effect=fake_params),
+        patch("ltbox.actions.edl.ensure_edl_requirements"),
+        patch("ltbox.actions.edl.time.sleep") as mock_sleep,
+        patch("ltbox.actions.edl.utils.ui") as mock_ui,
+    ):
+        edl.dump_partitions(
+            dev,
+            additional_targets=["broken", "boot_a", "missing"],
+            default_targets=False,
+        )
+
+    assert dev.edl.read_partition.call_count == 1
+    assert mock_sleep.call_count == 1
+    mock_ui.error.assert_called_once_with(
+        utils.get_string("act_err_dump").format(target="broken", e="no avbtool")
+    )
+
+
+def test_read_anti_rollback_reads_dumps(mock_env):
+    from ltbox.actions import arb
+
+    backup = mock_env["OUTPUT_DIR"]
+    dumped_boot = backup / "boot_a.img"
+    dumped_vbmeta = backup / "vbmeta_system_a.img"
+    for path in (
+        dumped_boot,
+        dumped_vbmeta,
+        mock_env["IMAGE_DIR"] / const.FN_BOOT,
+        mock_env["IMAGE_DIR"] / const.FN_VBMETA_SYSTEM,
+    ):
+        path.write_bytes(b"\0")
+
+    indices = {
+        dumped_boot: "3",
+        dumped_vbmeta: "2",
+        mock_env["IMAGE_DIR"] / const.FN_BOOT: "3",
+        mock_env["IMAGE_DIR"] / const.FN_VBMETA_SYSTEM: "2",
+    }
+
+    with (
+        patch(
+            "ltbox.actions.arb.extract_image_avb_info",
+            side_effect=lambda p: {"rollback": indices[p]},
+        ),
+        patch("ltbox.actions.arb.utils.check_dependencies"),
+        patch("ltbox.actions.arb.utils.ui"),
+    ):
+        result = arb.read_anti_rollback(dumped_boot, dumped_vbmeta)
+
+    assert result == (arb.ArbStatus.MATCH, 3, 2)
+
+
+def test_convert_region_images_reads_avb_info_from_backup(mock_env, tmp_path):
+    from ltbox.actions import region
+
+    base = tmp_path / "base"
+    base.mkdir()
+    (mock_env["IMAGE_DIR"] / const.FN_VENDOR_BOOT).write_bytes(b"vb")
+    (mock_env["IMAGE_DIR"] / const.FN_VBMETA).write_bytes(b"vbmeta")
+
+    def fake_convert(path, target_region):
+        (base / const.FN_VENDOR_BOOT_PRC).write_bytes(b"prc")
+        return True
+
+    info = {
+        "partition_size": "4096",
+        "name": "vendor_boot",
+        "rollback": "0",
+        "salt": "00",
+        "algorithm": "SHA256_RSA4096",
+    }
+    dev = MagicMock(skip_adb=True)
+
+    with (
+        patch.object(const, "BASE_DIR", base),
+        patch.object(const, "BACKUP_DIR", tmp_path / "backup"),
+        patch("ltbox.actions.region.convert_vendor_boot", side_effect=fake_convert),
+        patch("ltbox.actions.region.prefetch_avb_info") as mock_prefetch,
+        patch(
+            "ltbox.actions.region.extract_image_avb_info", return_value=info
+        ) as mock_info,
+        patch("ltbox.actions.region._apply_hash_footer") as mock_footer,
+        patch(
+            "ltbox.actions.region.rebuild_vbmeta_with_chained_images"
+        ) as mock_rebuild,
+        patch("ltbox.actions.region.utils.ui"),
+    ):
+        region.convert_region_images(dev, target_region="PRC")
+
+    backups = [base / const.FN_VENDOR_BOOT_BAK, base / const.FN_VBMETA_BAK]
+    mock_prefetch.assert_called_once_with(backups)
+    assert [c.args[0] for c in mock_info.call_args_list] == backups
+    assert mock_rebuild.call_args.kwargs["vbmeta_info"] is info
+    assert mock_footer.call_args.args[1] is info
+    assert (mock_env["OUTPUT_DIR"] / const.FN_VENDOR_BOOT).exists()
+
+
+def test_convert_region_images_keeps_footer_when_unchanged(mock_env, tmp_path):
+    from ltbox.actions import region
+
+    base = tmp_path / "base"
+    base.mkdir()
+    (mock_env["IMAGE_DIR"] / const.FN_VENDOR_BOOT).write_bytes(b"vb")
+    (mock_env["IMAGE_DIR"] / const.FN_VBMETA).write_bytes(b"vbmeta")
+    dev = MagicMock(skip_adb=True)
+
+    with (
+        patch.object(const, "BASE_DIR", base),
+        patch.object(const, "BACKUP_DIR", tmp_path / "backup"),
+        patch("ltbox.actions.region.prefetch_avb_info"),
+        patch("ltbox.actions.region.extract_image_avb_info", return_value={}),
+        patch("ltbox.actions.region._apply_hash_footer") as mock_footer,
+        patch("ltbox.actions.region.rebuild_vbmeta_with_chained_images"),
+        patch("ltbox.actions.region.utils.ui"),
+    ):
+        region.convert_region_images(dev, target_region="PRC")
+
+    mock_footer.assert_not_called()
+    assert (mock_env["OUTPUT_DIR"] / const.FN_VENDOR_BOOT).read_bytes() == b"vb"
+
+
+def test_convert_region_images_fails_when_vendor_boot_unreadable(mock_env, tmp_path):
+    from ltbox.actions import region
+
+    base = tmp_path / "base"
+    base.mkdir()
+    (mock_env["IMAGE_DIR"] / const.FN_VENDOR_BOOT).write_bytes(b"vb")
+    (mock_env["IMAGE_DIR"] / const.FN_VBMETA).write_bytes(b"vbmeta")
+    dev = MagicMock(skip_adb=True)
+
+    with (
+        patch.object(const, "BASE_DIR", base),
+        patch.object(const, "BACKUP_DIR", tmp_path / "backup"),
+        patch("ltbox.patch.region.utils._process_binary_file", return_value=False),
+        patch("ltbox.actions.region.prefetch_avb_info"),
+        patch("ltbox.actions.region.extract_image_avb_info", return_value={}),
+        patch("ltbox.actions.region._apply_hash_footer") as mock_footer,
+        patch(
+            "ltbox.actions.region.rebuild_vbmeta_with_chained_images"
+        ) as mock_rebuild,
+        patch("ltbox.actions.region.utils.ui"),
+        pytest.raises(RuntimeError),
+    ):
+        region.convert_region_images(dev, target_region="PRC")
+
+    mock_footer.assert_not_called()
+    mock_rebuild.assert_not_called()
+    assert not (base / const.FN_VENDOR_BOOT_PRC).exists()
+
+
+def test_convert_vendor_boot_raises_on_missing_input(tmp_path):
+    from ltbox.patch.region import convert_vendor_boot
+
+    with patch("ltbox.patch.region.utils.ui"), pytest.raises(RuntimeError):
+        convert_vendor_boot(str(tmp_path / "vendor_boot.bak.img"))
+
+    assert not (tmp_path / const.FN_VENDOR_BOOT_PRC).exists()
+
+
+def _encrypt_x(path, body):
+    import hashlib
+    import struct
+
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from ltbox import crypto
+
+    iv, salt = b"\x01" * 16, b"\x02" * 16
+    plain = struct.pack("<q", len(body)) + b"\xcf\x06\x05\x04\x03\x02\x01\xfc"
+    plain += body + hashlib.sha256(body).digest()
+    plain += b"\0" * (-len(plain) % 16)
+    encryptor = Cipher(algorithms.AES(crypto.generate(salt)), modes.CBC(iv)).encryptor()
+    path.write_bytes(iv + salt + encryptor.update(plain) + encryptor.finalize())
+
+
+def test_decrypt_files_reports_in_order(tmp_path):
+    x_files = []
+    for i in range(4):
+        x_file = tmp_path / f"rawprogram{i}.x"
+        _encrypt_x(x_file, f"<data>{i}</data>".encode())
+        x_files.append(x_file)
+    broken = tmp_path / "patch0.x"
+    broken.write_bytes(b"\0" * 64)
+    x_files.insert(2, broken)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    with patch("ltbox.actions.xml.utils.ui") as mock_ui:
+        assert xml_action._decrypt_files(x_files, out_dir) == 4
+
+    expected = []
+    for x_file in x_files:
+        if x_file is broken:
+            expected += [
+                utils.get_string("img_decrypt_broken"),
+                utils.get_string("img_xml_decrypt_fail").format(name=broken.name),
+            ]
+            continue
+        body = f"<data>{x_file.stem[-1]}</data>".encode()
+        assert (out_dir / f"{x_file.stem}.xml").read_bytes() == body
+        success = utils.get_string("img_decrypt_success")
+        size_unit = utils.get_string("img_decrypt_bytes")
+        expected += [
+            f"{success} {len(body)} {size_unit}",
+            utils.get_string("img_xml_decrypt_ok").format(
+                src=x_file.name, dst=f"{x_file.stem}.xml"
+            ),
+        ]
+    assert [c.args[0] for c in mock_ui.buffer.call_args_list] == expected
+    mock_ui.echo.assert_not_called()
+
+
+def test_prepare_flash_files_later_folders_win(mock_env):
+    (mock_env["OUTPUT_DIR"] / "boot.img").write_bytes(b"output")
+    (mock_env["OUTPUT_ANTI_ROLLBACK_DIR"] / "boot.img").write_bytes(b"arb")
+    (mock_env["OUTPUT_XML_DIR"] / "rawprogram0.xml").write_bytes(b"xml")
+    (mock_env["OUTPUT_DP_DIR"] / "persist.img").write_bytes(b"dp")
+
+    with patch("ltbox.actions.edl.utils.ui"):
+        edl._prepare_flash_files(skip_dp=True)
+
+    image_dir = mock_env["IMAGE_DIR"]
+    assert (image_dir / "boot.img").read_bytes() == b"arb"
+    assert (image_dir / "rawprogram0.xml").read_bytes() == b"xml"
+    assert not (image_dir / "persist.img").exists()
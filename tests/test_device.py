@@ -34,3 +34,81 @@ def test_fastboot_slot_detection_failure():
     ):
         with pytest.raises(DeviceCommandError):
             manager.get_slot_suffix()
+
+
+def test_controller_caches_slot_and_model_per_task():
+    from ltbox.device import DeviceController
+
+    adb = MagicMock()
+    adb.get_slot_suffix.return_value = "_b"
+    adb.get_model.return_value = "TB-Test"
+    dev = DeviceController(
+        adb_manager=adb, fastboot_manager=MagicMock(), edl_manager=MagicMock()
+    )
+
+    assert dev.detect_active_slot() == "_b"
+    assert dev.detect_active_slot() == "_b"
+    assert dev.get_model() == "TB-Test"
+    assert dev.get_model() == "TB-Test"
+    assert adb.get_slot_suffix.call_count == 1
+    assert adb.get_model.call_count == 1
+
+    dev.reset_task_state()
+    dev.detect_active_slot()
+    assert adb.get_slot_suffix.call_count == 2
+
+
+def test_prefetch_device_info_uses_single_getprop():
+    from ltbox.device import DeviceController
+
+    adb = MagicMock()
+    adb.skip_adb = False
+    adb.get_props.return_value = {
+        "ro.boot.slot_suffix": "_a",
+        "ro.product.model": "TB-Test",
+    }
+    dev = DeviceController(
+        adb_manager=adb, fastboot_manager=MagicMock(), edl_manager=MagicMock()
+    )
+
+    dev.prefetch_device_info()
+
+    assert dev.detect_active_slot() == "_a"
+    assert dev.get_model() == "TB-Test"
+    adb.get_slot_suffix.assert_not_called()
+    adb.get_model.assert_not_called()
+
+
+def test_adb_get_props_parses_getprop_output():
+    manager = AdbManager(skip_adb=False)
+    output = (
+        "[ro.boot.slot_suffix]: [_b]\r\n"
+        "[ro.product.model]: [Lenovo TB-Test]\r\n"
+        "[ro.other]: [x]\r\n"
+    )
+    with patch.object(manager, "_with_device", return_value=output):
+        props = manager.get_props(["ro.boot.slot_suffix", "ro.product.model"])
+
+    assert props == {
+        "ro.boot.slot_suffix": "_b",
+        "ro.product.model": "Lenovo TB-Test",
+    }
+
+
+def test_ensure_edl_mode_returns_once_port_appears():
+    from ltbox.device import DeviceController
+
+    edl = MagicMock()
+    edl.check_device.side_effect = [None, None, "COM5"]
+    dev = DeviceController(
+        adb_manager=MagicMock(skip_adb=False),
+        fastboot_manager=MagicMock(),
+        edl_manager=edl,
+    )
+
+    with patch("ltbox.utils.time.sleep") as sleep:
+        dev.ensure_edl_mode()
+
+    dev.adb.reboot.assert_called_once_with("edl")
+    assert edl.check_device.call_count == 3
+    sleep.assert_called_once_with(0.5)
@@ -60,3 +60,14 @@ class TestI18n:
                 continue
             diff = base_k - k
             assert not diff, f"{n} missing keys from {base}: {diff}"
+
+    def test_language_switch_clears_cache(self):
+        from ltbox import i18n
+
+        try:
+            i18n.load_lang("en")
+            assert i18n.get_string("lang_native_name") == "English"
+            i18n.load_lang("ko")
+            assert i18n.get_string("lang_native_name") == "한국어"
+        finally:
+            i18n.load_lang("en")
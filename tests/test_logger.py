@@ -0,0 +1,22 @@
+from logging.handlers import QueueHandler
+
+from ltbox import logger as logger_module
+
+
+def test_logging_context_writes_file_through_queue(tmp_path):
+    log_file = tmp_path / "log.txt"
+
+    with logger_module.logging_context(str(log_file)) as log:
+        handler_count = len(log.handlers)
+        with logger_module.logging_context(str(tmp_path / "nested.txt")):
+            assert len(log.handlers) == handler_count
+        log.info("first line")
+        log.info("second line")
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "first line" in content
+    assert content.index("first line") < content.index("second line")
+    assert not (tmp_path / "nested.txt").exists()
+    assert not any(
+        isinstance(h, QueueHandler) for h in logger_module.get_logger().handlers
+    )
@@ -68,3 +68,77 @@ def test_patch_chained_image_rollback_noop(fw_pkg, tmp_path):
 
     assert patched.exists()
     assert patched.read_bytes() == source.read_bytes()
+
+
+def _avb_header(rollback):
+    header = bytearray(256)
+    header[:4] = b"AVB0"
+    header[112:120] = rollback.to_bytes(8, "big")
+    return bytes(header)
+
+
+def test_read_rollback_index_vbmeta_image(tmp_path):
+    image = tmp_path / "vbmeta_system.img"
+    image.write_bytes(_avb_header(7) + b"\0" * 4096)
+
+    assert avb.read_rollback_index(image) == 7
+
+
+def test_read_rollback_index_from_footer(tmp_path):
+    image = tmp_path / "boot.img"
+    vbmeta_offset = 8192
+    footer = (
+        avb._AVB_FOOTER.pack(b"AVBf", 1, 0, vbmeta_offset, vbmeta_offset, 256)
+    ).ljust(64, b"\0")
+    data = b"ANDROID!".ljust(vbmeta_offset, b"\0") + _avb_header(5)
+    image.write_bytes(data.ljust(65536 - 64, b"\0") + footer)
+
+    assert avb.read_rollback_index(image) == 5
+
+
+def test_read_rollback_index_without_avb(tmp_path):
+    image = tmp_path / "boot.img"
+    image.write_bytes(b"\0" * 4096)
+
+    assert avb.read_rollback_index(image) is None
+
+
+def test_extract_image_avb_info_reuses_output_for_unchanged_image(tmp_path):
+    image = tmp_path / "boot.img"
+    image.write_bytes(b"\0" * 64)
+    output = "Image size:         4096 bytes\nRollback Index:     3\n"
+
+    with (
+        patch("ltbox.patch.avb.utils.AvbToolWrapper") as mock_tool,
+        patch("ltbox.patch.avb.utils.ui"),
+    ):
+        mock_tool.return_value.run.return_value.stdout = output
+        first = avb.extract_image_avb_info(image)
+        second = avb.extract_image_avb_info(image)
+        assert mock_tool.return_value.run.call_count == 1
+
+        image.write_bytes(b"\0" * 128)
+        avb.extract_image_avb_info(image)
+        assert mock_tool.return_value.run.call_count == 2
+
+    assert first == second
+    assert first["rollback"] == "3"
+    assert first is not second
+
+
+def test_prefetch_avb_info_fills_cache(tmp_path):
+    images = [tmp_path / "boot.img", tmp_path / "vbmeta_system.img"]
+    for i, image in enumerate(images):
+        image.write_bytes(b"\0" * (32 + i))
+
+    with (
+        patch("ltbox.patch.avb.utils.AvbToolWrapper") as mock_tool,
+        patch("ltbox.patch.avb.utils.ui"),
+    ):
+        mock_tool.return_value.run.return_value.stdout = "Rollback Index: 1\n"
+        avb.prefetch_avb_info(images)
+        assert mock_tool.return_value.run.call_count == 2
+
+        for image in images:
+            assert avb.extract_image_avb_info(image)["rollback"] == "1"
+        assert mock_tool.return_value.run.call_count == 2
@@ -0,0 +1,68 @@
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ltbox.patch import root
+
+
+def test_get_kernel_version_finds_linux_banner(tmp_path):
+    kernel = tmp_path / "kernel"
+    kernel.write_bytes(
+        b"\x00\x01" * 64
+        + b"1.2.3 4.5.6 noise\x00"
+        + b"Linux version %s (%s)\x00"
+        + b"Linux version 6.1.75-android14-11 (build@host) #1 SMP\x00"
+        + b"\xff" * 32
+    )
+
+    assert root.get_kernel_version(kernel) == "6.1.75"
+
+
+def test_get_kernel_version_without_banner(tmp_path):
+    kernel = tmp_path / "kernel"
+    kernel.write_bytes(b"\x00" * 128 + b"version 5.10.0 but no marker\x00")
+
+    assert root.get_kernel_version(kernel) is None
+
+
+def test_sha1_file_matches_hashlib(tmp_path):
+    image = tmp_path / "init_boot.img"
+    data = b"ANDROID!" + bytes(range(256)) * 8192
+    image.write_bytes(data)
+
+    assert root._sha1_file(image) == hashlib.sha1(data).hexdigest()
+
+
+def test_get_kernel_version_empty_file(tmp_path):
+    kernel = tmp_path / "kernel"
+    kernel.write_bytes(b"")
+
+    assert root.get_kernel_version(kernel) is None
+
+
+def test_kernel_version_pattern_requires_full_match():
+    assert root._KVER_RE.fullmatch("6.1.75")
+    assert not root._KVER_RE.fullmatch("6.1.75extra")
+
+
+def test_repack_boot_writes_to_output_path(tmp_path):
+    out = tmp_path / "out" / "boot_root.img"
+    out.parent.mkdir()
+    out.write_bytes(b"stale")
+    mb = MagicMock()
+    mb.run.side_effect = lambda *args, cwd: Path(args[2]).write_bytes(b"new")
+
+    assert root._repack_boot(mb, "boot.img", tmp_path, out)
+    mb.run.assert_called_once_with("repack", "boot.img", str(out), cwd=tmp_path)
+    assert out.read_bytes() == b"new"
+
+
+def test_repack_boot_falls_back_to_new_boot_img(tmp_path):
+    out = tmp_path / "out" / "boot_root.img"
+    out.parent.mkdir()
+    mb = MagicMock()
+    mb.run.side_effect = lambda *args, cwd: (cwd / "new-boot.img").write_bytes(b"new")
+
+    assert root._repack_boot(mb, "boot.img", tmp_path, out)
+    assert out.read_bytes() == b"new"
+    assert not (tmp_path / "new-boot.img").exists()
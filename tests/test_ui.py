@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from ltbox import ui as ui_module
+
+
+def test_clear_writes_ansi_sequence(capsys):
+    console = ui_module.ConsoleUI()
+    with (
+        patch("ltbox.ui._enable_vt_mode", return_value=True),
+        patch("ltbox.ui.os.system") as mock_system,
+    ):
+        console.clear()
+        console.clear()
+
+    assert capsys.readouterr().out == ui_module._CLEAR_SCREEN * 2
+    mock_system.assert_not_called()
+
+
+def test_clear_falls_back_to_cls():
+    console = ui_module.ConsoleUI()
+    with (
+        patch("ltbox.ui._enable_vt_mode", return_value=False),
+        patch("ltbox.ui.os.system") as mock_system,
+    ):
+        console.clear()
+
+    mock_system.assert_called_once_with("cls")
+
+
+def test_buffered_lines_flush_before_echo():
+    console = ui_module.ConsoleUI()
+    with patch("ltbox.ui.logger") as mock_logger:
+        console.buffer("[STEP 1] one")
+        console.buffer("slot: _a")
+        mock_logger.info.assert_not_called()
+
+        console.echo("[*] action")
+
+    assert [c.args[0] for c in mock_logger.info.call_args_list] == [
+        "[STEP 1] one\nslot: _a",
+        "[*] action",
+    ]
+
+
+def test_prompt_flushes_pending_lines():
+    console = ui_module.ConsoleUI()
+    with (
+        patch("ltbox.ui.logger") as mock_logger,
+        patch("builtins.input", return_value="y"),
+    ):
+        console.buffer("question context")
+        assert console.prompt("?") == "y"
+
+    mock_logger.info.assert_called_once_with("question context")
+
+
+def test_banner_is_one_record():
+    console = ui_module.ConsoleUI()
+    with (
+        patch("ltbox.ui.logger") as mock_logger,
+        patch.object(console, "get_term_width", return_value=5),
+    ):
+        console.banner(["line 1", "line 2"], char="!")
+
+    mock_logger.info.assert_called_once_with("\n!!!!!\nline 1\nline 2\n!!!!!\n")
+
+
+def test_error_banner_is_red():
+    console = ui_module.ConsoleUI()
+    with (
+        patch("ltbox.ui.logger") as mock_logger,
+        patch.object(console, "get_term_width", return_value=3),
+    ):
+        console.banner(["oops"], char="!", error=True)
+
+    mock_logger.error.assert_called_once_with("\033[91m\n!!!\noops\n!!!\n\033[0m")
+
+
+def test_buffer_keeps_lines_from_threads():
+    import threading
+
+    console = ui_module.ConsoleUI()
+    with patch("ltbox.ui.logger") as mock_logger:
+        workers = [
+            threading.Thread(
+                target=lambda n=n: [console.buffer(f"{n}:{i}") for i in range(100)]
+            )
+            for n in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        console.flush()
+
+    lines = "\n".join(c.args[0] for c in mock_logger.info.call_args_list).split("\n")
+    assert sorted(lines) == sorted(f"{n}:{i}" for n in range(4) for i in range(100))
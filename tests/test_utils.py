@@ -1,6 +1,7 @@
 import hashlib
 import json
 import os
+import shutil
 import subprocess
 import sys
 import urllib.error
@@ -35,6 +36,15 @@ class TestUtils:
         assert res.returncode == 0
         assert "ok" in res.stdout
 
+    def test_run_cmd_streams_lines(self):
+        lines = []
+        script = "import sys; sys.stdout.write('one\\r\\ntwo\\nthree')"
+        res = utils.run_command(
+            [sys.executable, "-c", script], env=dict(os.environ), on_output=lines.append
+        )
+        assert res.stdout == "one\ntwo\nthree"
+        assert lines == ["one\n", "two\n", "three"]
+
     def test_pbkdf1(self):
         salt = b"1234567890123456"
         k1 = crypto.PBKDF1("OSD", salt, 32, hashlib.sha256, 1000)
@@ -91,6 +101,105 @@ class TestUtils:
             with pytest.raises(RuntimeError):
                 utils.wait_for_files(target, ["missing.bin"], "need files")
 
+    def test_move_file_falls_back_to_shutil_move(self, tmp_path):
+        src = tmp_path / "src.img"
+        dst = tmp_path / "dst.img"
+        src.write_bytes(b"data")
+        with (
+            patch("ltbox.utils.os.replace", side_effect=OSError),
+            patch("ltbox.utils.shutil.move") as mock_move,
+        ):
+            utils.move_file(src, dst)
+        mock_move.assert_called_once_with(str(src), str(dst))
+
+    def test_iter_matching_single_pass(self, tmp_path):
+        for name in ("rawprogram0.x", "rawprogram0.xml", "patch0.xml", "boot.img"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "dir.xml").mkdir()
+
+        found = utils._iter_matching(tmp_path, ("*.x", "*.xml"))
+
+        assert sorted(p.name for p in found) == [
+            "patch0.xml",
+            "rawprogram0.x",
+            "rawprogram0.xml",
+        ]
+        assert list(utils._iter_matching(tmp_path / "missing", ("*",))) == []
+
+    def test_is_dir_nonempty(self, tmp_path):
+        assert not utils.is_dir_nonempty(tmp_path / "missing")
+        assert not utils.is_dir_nonempty(tmp_path)
+        (tmp_path / "file.txt").write_text("x", encoding="utf-8")
+        assert utils.is_dir_nonempty(tmp_path)
+        assert not utils.is_dir_nonempty(tmp_path / "file.txt")
+
+    def test_process_binary_file_applies_patches(self, tmp_path):
+        from ltbox.patch import region
+
+        src = tmp_path / "devinfo.img"
+        dst = tmp_path / "devinfo_modified.img"
+        src.write_bytes(b"\x00" * 16 + b"CNXX" + b"\xff" * 8 + b"CNXX" + b"\x00" * 4)
+
+        with patch("ltbox.utils.ui"), patch("ltbox.patch.region.utils.ui"):
+            assert utils._process_binary_file(
+                src,
+                dst,
+                region._patch_country_code_logic,
+                current_code="CN",
+                replacement_code="US",
+            )
+
+        assert dst.read_bytes() == (
+            b"\x00" * 16 + b"USXX" + b"\xff" * 8 + b"USXX" + b"\x00" * 4
+        )
+        assert b"CNXX" in src.read_bytes()
+
+    def test_fast_rmtree_empty_and_populated(self, tmp_path):
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        full = tmp_path / "full"
+        (full / "sub").mkdir(parents=True)
+        (full / "sub" / "a.img").write_bytes(b"x")
+
+        with patch("ltbox.utils.shutil.rmtree", wraps=shutil.rmtree) as mock_rmtree:
+            utils._fast_rmtree(empty)
+            mock_rmtree.assert_not_called()
+            utils._fast_rmtree(full)
+            mock_rmtree.assert_called_once_with(full)
+
+        assert not empty.exists()
+        assert not full.exists()
+
+    def test_unlink_files_reports_per_file(self, tmp_path):
+        files = [tmp_path / f"rawprogram{i}.xml" for i in range(4)]
+        for f in files[:3]:
+            f.write_text("x", encoding="utf-8")
+
+        results = utils.unlink_files(files)
+
+        assert [p for p, _ in results] == files
+        assert [e is None for _, e in results] == [True, True, True, False]
+        assert not any(f.exists() for f in files)
+
+    def test_wait_for_files_present(self, tmp_path):
+        for name in ("boot.img", "vbmeta.img"):
+            (tmp_path / name).write_bytes(b"")
+        with patch("ltbox.utils.ui") as mock_ui:
+            assert utils.wait_for_files(tmp_path, ["boot.img", "vbmeta.img"], "x")
+        mock_ui.prompt.assert_not_called()
+
+    def test_process_binary_file_copies_unchanged(self, tmp_path):
+        src = tmp_path / "in.img"
+        dst = tmp_path / "out.img"
+        src.write_bytes(b"payload")
+
+        with patch("ltbox.utils.ui"):
+            assert utils._process_binary_file(
+                src, dst, lambda c: (c, {"changed": False})
+            )
+
+        assert dst.read_bytes() == b"payload"
+
     def test_get_latest_release_versions(self):
         releases = [
             {"tag_name": "v1.0.0", "draft": False, "prerelease": False},
@@ -210,6 +319,58 @@ class TestUtils:
                 utils.get_string("utils_err_non_release_download")
             )
 
+    def test_check_dependencies_reports_missing_tools(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        tools_dir = tmp_path / "tools"
+        tools_dir.mkdir()
+        python_exe = tmp_path / "python.exe"
+        python_exe.write_text("ok", encoding="utf-8")
+        adb_exe = tools_dir / "adb.exe"
+        adb_exe.write_text("ok", encoding="utf-8")
+
+        with (
+            patch("ltbox.utils.const.BASE_DIR", tmp_path),
+            patch("ltbox.utils.const.PYTHON_EXE", python_exe),
+            patch("ltbox.utils.const.ADB_EXE", adb_exe),
+            patch("ltbox.utils.const.FASTBOOT_EXE", tools_dir / "fastboot.exe"),
+            patch("ltbox.utils.const.AVBTOOL_PY", tmp_path / "avb" / "avbtool.py"),
+            patch("ltbox.utils.const.KEY_MAP", {}),
+            patch("ltbox.utils.ui") as mock_ui,
+        ):
+            with pytest.raises(RuntimeError):
+                utils.check_dependencies()
+
+        reported = [c.args[0] for c in mock_ui.echo.call_args_list]
+        assert utils.get_string("utils_missing_dep").format(name="Fastboot") in reported
+        assert utils.get_string("utils_missing_dep").format(name="avbtool") in reported
+        assert utils.get_string("utils_missing_dep").format(name="ADB") not in reported
+
+    def test_check_dependencies_notices_removed_tools(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        tools = [tmp_path / name for name in ("python.exe", "adb.exe", "fb.exe")]
+        for path in tools:
+            path.write_text("ok", encoding="utf-8")
+        avbtool_py = tmp_path / "avbtool.py"
+        avbtool_py.write_text("ok", encoding="utf-8")
+
+        with (
+            patch("ltbox.utils.const.BASE_DIR", tmp_path),
+            patch("ltbox.utils.const.PYTHON_EXE", tools[0]),
+            patch("ltbox.utils.const.ADB_EXE", tools[1]),
+            patch("ltbox.utils.const.FASTBOOT_EXE", tools[2]),
+            patch("ltbox.utils.const.AVBTOOL_PY", avbtool_py),
+            patch("ltbox.utils.const.KEY_MAP", {}),
+            patch("ltbox.utils.ui") as mock_ui,
+        ):
+            utils.check_dependencies()
+            tools[1].unlink()
+            with pytest.raises(RuntimeError):
+                utils.check_dependencies()
+
+        reported = [c.args[0] for c in mock_ui.echo.call_args_list]
+        assert utils.get_string("utils_deps_found") in reported
+        assert utils.get_string("utils_missing_dep").format(name="ADB") in reported
+
     @pytest.mark.integration
     def test_check_dependencies_allows_release_package_edl_tools(
         self, tmp_path, fw_pkg
@@ -279,3 +440,96 @@ class TestUtils:
 
             args, _ = m_dl.call_args
             assert args[0] == "http://latest-ok"
+
+    def test_wait_for_directory_rechecks_after_prompt(self, tmp_path):
+        target = tmp_path / "image"
+
+        def user_copies_files():
+            (target / "boot.img").write_bytes(b"")
+
+        with (
+            patch.object(utils.ui, "clear"),
+            patch.object(utils.ui, "echo"),
+            patch.object(utils.ui, "prompt", side_effect=user_copies_files) as prompt,
+            patch.object(utils.time, "sleep") as sleep,
+        ):
+            assert utils.wait_for_directory(target, "copy files") is True
+
+        prompt.assert_called_once()
+        sleep.assert_called_once_with(0)
+
+    def test_copy_file_copies_contents(self, tmp_path):
+        src = tmp_path / "vendor_boot.img"
+        dst = tmp_path / "vendor_boot.bak.img"
+        src.write_bytes(b"ANDROID!" * 1024)
+        dst.write_bytes(b"stale")
+
+        utils.copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_prefetched_gki_releases_are_used_once(self):
+        releases = [{"tag_name": "v1", "draft": False, "body": "", "assets": []}]
+
+        with (
+            patch.object(
+                downloader,
+                "_get_gki_release_source",
+                return_value=("WildKernels/GKI_KernelSU_SUSFS", "latest"),
+            ),
+            patch.object(
+                downloader, "_fetch_release_list", return_value=releases
+            ) as m_fetch,
+        ):
+            downloader.prefetch_gki_releases()
+            assert downloader._get_release_list("WildKernels/GKI_KernelSU_SUSFS") == (
+                releases
+            )
+            assert m_fetch.call_count == 1
+
+            downloader._get_release_list("WildKernels/GKI_KernelSU_SUSFS")
+            assert m_fetch.call_count == 2
+
+    def test_failed_gki_prefetch_is_reported_and_retried(self):
+        releases = [{"tag_name": "v1", "draft": False, "body": "", "assets": []}]
+
+        with (
+            patch.object(
+                downloader,
+                "_get_gki_release_source",
+                return_value=("WildKernels/GKI_KernelSU_SUSFS", "latest"),
+            ),
+            patch.object(
+                downloader,
+                "_fetch_release_list",
+                side_effect=[OSError("offline"), releases],
+            ),
+            patch("ltbox.downloader.utils.ui") as mock_ui,
+        ):
+            downloader.prefetch_gki_releases()
+            assert downloader._get_release_list("WildKernels/GKI_KernelSU_SUSFS") == (
+                releases
+            )
+
+        mock_ui.warn.assert_called_once()
+        assert "offline" in mock_ui.warn.call_args[0][0]
+
+    def test_tree_copy_jobs_merge_into_existing_dir(self, tmp_path):
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.img").write_bytes(b"new")
+        (src / "b.xml").write_bytes(b"b")
+        (src / "sub" / "c.bin").write_bytes(b"c")
+        dst = tmp_path / "dst"
+        dst.mkdir()
+        (dst / "a.img").write_bytes(b"old")
+        (dst / "keep.img").write_bytes(b"keep")
+
+        jobs = utils.tree_copy_jobs(src, dst)
+
+        assert len(jobs) == 3
+        assert utils.copy_files(jobs) == [None, None, None]
+
+        assert (dst / "a.img").read_bytes() == b"new"
+        assert (dst / "sub" / "c.bin").read_bytes() == b"c"
+        assert (dst / "keep.img").read_bytes() == b"keep"
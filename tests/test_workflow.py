@@ -1,15 +1,24 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
 from ltbox import workflow
+from ltbox.errors import LTBoxError
 
 
-def test_patch_all_flow_standard(mock_env):
+def test_patch_all_flow_standard(mock_env, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     mock_dev = MagicMock()
     mock_dev.skip_adb = False
     mock_dev.detect_active_slot.return_value = "_a"
-    mock_dev.adb.get_model.return_value = "TestModel"
+    mock_dev.get_model.return_value = "TestModel"
+
+    backup_dir = tmp_path / "backup"
+    backup_dir.mkdir()
+    (backup_dir / "boot_a.img").write_bytes(b"x")
+    (backup_dir / "vbmeta_system_a.img").write_bytes(b"x")
 
     with (
+        patch("ltbox.constants.BACKUP_DIR", backup_dir),
         patch("ltbox.workflow.actions") as mock_actions,
         patch("ltbox.workflow.utils.ui"),
         patch("ltbox.workflow._wait_for_input_images"),
@@ -28,7 +37,8 @@ def test_patch_all_flow_standard(mock_env):
         mock_actions.flash_full_firmware.assert_called_once()
 
 
-def test_patch_all_skip_arb():
+def test_patch_all_skip_arb(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     mock_dev = MagicMock()
     with (
         patch("ltbox.workflow.actions") as mock_actions,
@@ -39,3 +49,59 @@ def test_patch_all_skip_arb():
         workflow.patch_all(dev=mock_dev, skip_rollback=True)
 
         mock_actions.read_anti_rollback.assert_not_called()
+
+
+def test_cleanup_previous_outputs_removes_populated(mock_env, tmp_path):
+    root_dir = tmp_path / "output_root"
+    (root_dir / "sub").mkdir(parents=True)
+    (mock_env["OUTPUT_DIR"] / "boot.img").write_bytes(b"x")
+
+    with patch("ltbox.constants.OUTPUT_ROOT_DIR", root_dir):
+        workflow._cleanup_previous_outputs(MagicMock())
+
+    assert not mock_env["OUTPUT_DIR"].exists()
+    assert not root_dir.exists()
+    assert mock_env["OUTPUT_XML_DIR"].is_dir()
+
+
+def test_cleanup_previous_outputs_wraps_os_error(mock_env, tmp_path):
+    (mock_env["OUTPUT_DIR"] / "boot.img").write_bytes(b"x")
+    with (
+        patch("ltbox.constants.OUTPUT_ROOT_DIR", tmp_path / "output_root"),
+        patch("ltbox.workflow.shutil.rmtree", side_effect=OSError("busy")),
+    ):
+        with pytest.raises(LTBoxError):
+            workflow._cleanup_previous_outputs(MagicMock())
+
+
+def test_check_and_patch_arb_requires_dumps(tmp_path):
+    ctx = MagicMock(boot_target="boot_a", vbmeta_target="vbmeta_system_a")
+    (tmp_path / "boot_a.img").write_bytes(b"x")
+
+    with (
+        patch("ltbox.constants.BACKUP_DIR", tmp_path),
+        patch("ltbox.workflow.actions") as mock_actions,
+    ):
+        with pytest.raises(LTBoxError):
+            workflow._check_and_patch_arb(ctx)
+
+    mock_actions.read_anti_rollback.assert_not_called()
+
+
+def test_run_step_writes_label_before_action():
+    from ltbox.ui import ConsoleUI
+
+    console = ConsoleUI()
+    records_at_action = []
+    with (
+        patch("ltbox.workflow.utils.ui", console),
+        patch("ltbox.ui.logger") as mock_logger,
+    ):
+        step = workflow.WorkflowStep(
+            "[STEP 2] dump",
+            lambda: records_at_action.append(mock_logger.info.call_count),
+        )
+        workflow._run_step(MagicMock(on_log=console.buffer), step)
+
+    assert records_at_action == [1]
+    mock_logger.info.assert_called_once_with("[STEP 2] dump")